@@ -0,0 +1,85 @@
+"""Measure the throughput of form pages that redirect after a POST.
+
+This is the common outcome of submitting an add or edit form
+successfully.  The form pages are called directly, without a WSGI
+server or a database in between.  Usage::
+
+  $ python benchmarks/formredirect.py [--requests 2000] [--repeat 5]
+"""
+from __future__ import print_function
+import argparse
+import time
+import warnings
+
+warnings.simplefilter('ignore')
+
+import grok
+from zope import interface, schema
+
+
+class IMammoth(interface.Interface):
+    name = schema.TextLine(title=u"Name")
+
+
+@grok.implementer(IMammoth)
+class Mammoth(grok.Model):
+    name = u'Manfred'
+
+
+class Master(grok.Layout):
+    grok.context(Mammoth)
+
+    def render(self):
+        return self.view.content()
+
+
+class Edit(grok.EditFormPage):
+    grok.context(Mammoth)
+
+    @grok.action('Save')
+    def save(self, **data):
+        self.applyData(self.context, **data)
+        self.redirect(self.url(self.context))
+
+
+def setup():
+    from zope.configuration import xmlconfig
+    from zope.site.folder import rootFolder
+    import grok.testing
+    xmlconfig.file('configure.zcml', grok)
+    grok.testing.grok(__name__)
+    root = rootFolder()
+    root['manfred'] = Mammoth()
+    return root['manfred']
+
+
+def run(context, requests):
+    from zope.component import getMultiAdapter
+    from zope.publisher.browser import TestRequest
+    start = time.time()
+    for i in range(requests):
+        request = TestRequest(
+            form={'form.name': u'Manfred %d' % i,
+                  'form.actions.save': u'Save'},
+            REQUEST_METHOD='POST')
+        getMultiAdapter((context, request), name='edit')()
+        assert request.response.getStatus() == 302
+    return time.time() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    options = parser.parse_args(argv)
+    context = setup()
+    run(context, options.requests // 10)
+    best = min(run(context, options.requests)
+               for i in range(options.repeat))
+    print('POST and redirect, best of %d: %.0f requests/s (%.1fus each)' % (
+        options.repeat, options.requests / best,
+        best / options.requests * 1e6))
+
+
+if __name__ == '__main__':
+    main()
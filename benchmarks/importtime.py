@@ -0,0 +1,49 @@
+"""Measure what ``import grok`` costs, using ``python -X importtime``.
+
+Reports the cumulative import time and the number of modules loaded by
+a bare ``import grok``, and by ``import grok`` followed by looking up
+the whole Grok API.  Usage::
+
+  $ python benchmarks/importtime.py [--repeat 5]
+"""
+from __future__ import print_function
+import argparse
+import subprocess
+import sys
+
+STATEMENTS = [
+    ('import grok', 'import grok'),
+    ('full API', 'import grok; [getattr(grok, n) for n in dir(grok)]'),
+    ]
+
+
+def importtime(statement):
+    """Return the import time in microseconds and the number of modules.
+    """
+    output = subprocess.run(
+        [sys.executable, '-W', 'ignore', '-X', 'importtime',
+         '-c', statement],
+        stderr=subprocess.PIPE, check=True).stderr.decode()
+    total = 0
+    modules = 0
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        modules += 1
+        total += int(self_time)
+    return total, modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    options = parser.parse_args(argv)
+    for label, statement in STATEMENTS:
+        results = [importtime(statement) for i in range(options.repeat)]
+        total, modules = min(results)
+        print('%-12s %8.1fms %5d modules' % (label, total / 1000.0, modules))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Measure catalog indexing during a bulk import.
+
+Every imported object is added to a container and then modified, like
+an add form that applies its data after adding.  The import runs in one
+transaction, once with the catalog updated right away and once with the
+updates queued until the commit.  Usage::
+
+  $ python benchmarks/indexing.py [--objects 100000]
+"""
+from __future__ import print_function
+import argparse
+import time
+import warnings
+
+warnings.simplefilter('ignore')
+
+import grok
+import transaction
+from zope import interface, schema
+from zope.catalog.catalog import Catalog
+from zope.catalog.field import FieldIndex
+from zope.catalog.interfaces import ICatalog
+from zope.catalog.text import TextIndex
+from zope.intid import IntIds
+from zope.intid.interfaces import IIntIds
+
+from grok import indexing
+
+
+class IMammoth(interface.Interface):
+    name = schema.TextLine(title=u"Name")
+    size = schema.Int(title=u"Size")
+
+
+def setup_catalog(catalog):
+    catalog['name'] = TextIndex('name', IMammoth)
+    catalog['size'] = FieldIndex('size', IMammoth)
+
+
+class Zoo(grok.Site, grok.Container):
+    grok.local_utility(IntIds, provides=IIntIds)
+    grok.local_utility(Catalog, provides=ICatalog, setup=setup_catalog)
+
+
+@grok.implementer(IMammoth)
+class Mammoth(grok.Model):
+    name = u''
+    size = 0
+
+
+def setup():
+    from zope.configuration import xmlconfig
+    import grok.testing
+    xmlconfig.file('configure.zcml', grok)
+    grok.testing.grok(__name__)
+
+
+def run(objects):
+    from ZODB import DB
+    from ZODB.MappingStorage import MappingStorage
+    from zope.component.hooks import setHooks, setSite
+    from zope.site.folder import rootFolder
+    db = DB(MappingStorage())
+    connection = db.open()
+    root = connection.root()['Application'] = rootFolder()
+    zoo = root['zoo'] = Zoo()
+    transaction.commit()
+    setHooks()
+    setSite(zoo)
+    try:
+        start = time.time()
+        for i in range(objects):
+            mammoth = zoo['mammoth-%06d' % i] = Mammoth()
+            mammoth.name = u'Mammoth number %d' % i
+            mammoth.size = i
+            grok.notify(grok.ObjectModifiedEvent(mammoth))
+        transaction.commit()
+        elapsed = time.time() - start
+        catalog = zoo.getSiteManager()['Catalog']
+        assert catalog['size'].documentCount() == objects
+        return elapsed
+    finally:
+        setSite(None)
+        connection.close()
+        db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--objects', type=int, default=100000)
+    options = parser.parse_args(argv)
+    setup()
+    for queued in (False, True):
+        if queued:
+            indexing.enable_queue()
+        else:
+            indexing.disable_queue()
+        elapsed = run(options.objects)
+        print('%-9s %d objects in %.1fs (%.0f objects/s)' % (
+            'queued' if queued else 'immediate', options.objects, elapsed,
+            options.objects / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,11 @@
+"""Benchmarks for the grok request pipeline.
+
+The scenarios in :mod:`benchmarks.pipeline.scenarios` are published
+in-process through ``zope.app.wsgi``, against a database set up by the
+same kind of test layer the functional tests use.  Run them from the
+root of the checkout with::
+
+  $ python -m benchmarks.pipeline [--requests 1000] [--threads 1]
+                                  [--output results.json]
+                                  [--compare baseline.json]
+"""
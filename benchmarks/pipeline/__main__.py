@@ -0,0 +1,187 @@
+"""Run the pipeline benchmarks.
+
+See :mod:`benchmarks.pipeline` for how to call this.
+"""
+from __future__ import print_function
+import argparse
+import datetime
+import io
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+warnings.simplefilter('ignore')
+
+import transaction
+import zope.app.wsgi
+import zope.app.wsgi.testlayer
+
+import benchmarks.pipeline
+from benchmarks.pipeline.app import populate
+from benchmarks.pipeline.scenarios import SCENARIOS
+
+
+def make_environ(scenario):
+    environ = {
+        'REQUEST_METHOD': scenario.method,
+        'SCRIPT_NAME': '',
+        'PATH_INFO': scenario.path,
+        'QUERY_STRING': '',
+        'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'HTTP_HOST': 'localhost',
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': io.BytesIO(scenario.body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+        }
+    if scenario.body:
+        environ['CONTENT_LENGTH'] = str(len(scenario.body))
+    if scenario.content_type:
+        environ['CONTENT_TYPE'] = scenario.content_type
+    return environ
+
+
+def request(app, scenario):
+    """Publish one request and return its latency and status code."""
+    status = []
+
+    def start_response(status_line, headers, exc_info=None):
+        status.append(int(status_line.split()[0]))
+
+    start = time.perf_counter()
+    result = app(make_environ(scenario), start_response)
+    try:
+        for chunk in result:
+            pass
+    finally:
+        close = getattr(result, 'close', None)
+        if close is not None:
+            close()
+    return time.perf_counter() - start, status[0]
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def measure(app, scenario, requests, threads):
+    def worker(count):
+        start = time.perf_counter()
+        outcomes = [request(app, scenario) for i in range(count)]
+        return outcomes, count / (time.perf_counter() - start)
+
+    counts = [requests // threads] * threads
+    counts[0] += requests - sum(counts)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        workers = list(pool.map(worker, counts))
+    elapsed = time.perf_counter() - start
+    outcomes = [outcome for chunk, rps in workers for outcome in chunk]
+    latencies = sorted(latency for latency, status in outcomes)
+    return dict(
+        requests=requests,
+        errors=sum(1 for latency, status in outcomes
+                   if status != scenario.status),
+        rps=requests / elapsed,
+        worker_rps=[rps for chunk, rps in workers],
+        mean_ms=sum(latencies) / len(latencies) * 1e3,
+        p50_ms=percentile(latencies, 0.5) * 1e3,
+        p90_ms=percentile(latencies, 0.9) * 1e3,
+        p99_ms=percentile(latencies, 0.99) * 1e3,
+        max_ms=latencies[-1] * 1e3,
+        )
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL,
+            cwd=os.path.dirname(__file__)).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def setup():
+    layer = zope.app.wsgi.testlayer.BrowserLayer(
+        benchmarks.pipeline, 'benchmark.zcml')
+    layer.setUp()
+    layer.testSetUp()
+    populate(layer.getRootFolder())
+    transaction.commit()
+    return zope.app.wsgi.WSGIPublisherApplication(layer.db)
+
+
+def report(results, baseline=None):
+    header = '%-12s %9s %9s %9s %9s %7s' % (
+        'scenario', 'req/s', 'p50 ms', 'p90 ms', 'p99 ms', 'errors')
+    if baseline is not None:
+        header += ' %8s' % 'change'
+    print(header)
+    for name, result in results.items():
+        line = '%-12s %9.0f %9.2f %9.2f %9.2f %7d' % (
+            name, result['rps'], result['p50_ms'], result['p90_ms'],
+            result['p99_ms'], result['errors'])
+        before = (baseline or {}).get(name)
+        if before is not None:
+            line += ' %+7.1f%%' % (
+                (result['rps'] / before['rps'] - 1) * 100)
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=benchmarks.pipeline.__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--warmup', type=int, default=50)
+    parser.add_argument('--threads', type=int, default=1)
+    parser.add_argument('--scenario', action='append', default=[],
+                        help='only run the named scenarios')
+    parser.add_argument('--output', help='write the results as JSON')
+    parser.add_argument('--compare', help='results of an earlier run')
+    options = parser.parse_args(argv)
+
+    # The error scenarios would log a traceback for every request.
+    logging.disable(logging.ERROR)
+    app = setup()
+    results = {}
+    for scenario in SCENARIOS:
+        if options.scenario and scenario.name not in options.scenario:
+            continue
+        for i in range(options.warmup):
+            request(app, scenario)
+        results[scenario.name] = measure(
+            app, scenario, options.requests, options.threads)
+
+    baseline = None
+    if options.compare:
+        with open(options.compare) as f:
+            baseline = json.load(f)['results']
+    report(results, baseline)
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(dict(
+                meta=dict(
+                    commit=git_commit(),
+                    created=datetime.datetime.now(
+                        datetime.timezone.utc).isoformat(),
+                    python=platform.python_version(),
+                    platform=platform.platform(),
+                    requests=options.requests,
+                    threads=options.threads),
+                results=results), f, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""The application the pipeline benchmarks are published against."""
+import grok
+from zope import interface, schema
+
+
+class IMammoth(interface.Interface):
+    name = schema.TextLine(title=u"Name")
+    size = schema.Int(title=u"Size")
+
+
+class Herd(grok.Application, grok.Container):
+    pass
+
+
+@grok.implementer(IMammoth)
+class Mammoth(grok.Model):
+
+    def __init__(self, name=u'', size=0):
+        self.name = name
+        self.size = size
+
+
+class Plain(grok.View):
+    grok.context(interface.Interface)
+
+    def render(self):
+        return u'Hello from %s' % self.context.__name__
+
+
+class Templated(grok.View):
+    grok.context(Mammoth)
+
+
+templated = grok.PageTemplate("""\
+<html>
+<body>
+<h1 tal:content="context/name">Name</h1>
+<p>Size: <span tal:replace="context/size" /></p>
+<a tal:attributes="href python:view.url(context)">Link</a>
+</body>
+</html>
+""")
+
+
+class Listing(grok.View):
+    grok.context(Herd)
+
+
+listing = grok.PageTemplate("""\
+<ul>
+<li tal:repeat="name context/keys" tal:content="name">name</li>
+</ul>
+""")
+
+
+class Master(grok.Layout):
+    grok.context(interface.Interface)
+
+
+master = grok.PageTemplate("""\
+<html>
+<body>
+<div tal:replace="structure view/content" />
+</body>
+</html>
+""")
+
+
+class Edit(grok.EditFormPage):
+    grok.context(Mammoth)
+
+    @grok.action('Save')
+    def save(self, **data):
+        self.applyData(self.context, **data)
+        self.redirect(self.url(self.context, 'templated'))
+
+
+class Broken(grok.View):
+    grok.context(Herd)
+
+    def render(self):
+        raise ValueError('Broken on purpose.')
+
+
+class ByNumber(grok.Traverser):
+    grok.context(Herd)
+
+    def traverse(self, name):
+        if name.startswith('number-'):
+            keys = sorted(self.context.keys())
+            return self.context.get(keys[int(name[7:]) % len(keys)])
+
+
+class HerdJSON(grok.JSON):
+    grok.context(Herd)
+
+    def names(self):
+        return sorted(self.context.keys())
+
+
+class HerdXMLRPC(grok.XMLRPC):
+    grok.context(Herd)
+
+    def size(self, name):
+        return self.context[name].size
+
+
+class IHerdRESTLayer(grok.IRESTLayer):
+    grok.restskin('herd')
+
+
+class MammothREST(grok.REST):
+    grok.context(Mammoth)
+    grok.layer(IHerdRESTLayer)
+
+    def GET(self):
+        return u'%s:%s' % (self.context.name, self.context.size)
+
+
+def populate(root, name='herd', size=100):
+    herd = root[name] = Herd()
+    for i in range(size):
+        herd['mammoth-%03d' % i] = Mammoth(u'Mammoth %d' % i, i)
+    return herd
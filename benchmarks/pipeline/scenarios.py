@@ -0,0 +1,46 @@
+"""The requests the pipeline benchmarks make.
+
+Each scenario is published against the ``herd`` application set up by
+:func:`benchmarks.pipeline.app.populate`.
+"""
+import collections
+from urllib.parse import urlencode
+
+Scenario = collections.namedtuple(
+    'Scenario', 'name method path body content_type status')
+
+
+def scenario(name, path, method='GET', body=b'', content_type=None,
+             status=200):
+    return Scenario(name, method, path, body, content_type, status)
+
+
+XMLRPC_BODY = b"""\
+<?xml version="1.0"?>
+<methodCall>
+<methodName>size</methodName>
+<params><param><value><string>mammoth-042</string></value></param></params>
+</methodCall>
+"""
+
+SCENARIOS = [
+    scenario('view', '/herd/plain'),
+    scenario('template', '/herd/mammoth-042/templated'),
+    scenario('listing', '/herd/listing'),
+    scenario('traversal', '/herd/mammoth-042/plain'),
+    scenario('traverser', '/herd/number-42/plain'),
+    scenario('form-get', '/herd/mammoth-042/edit'),
+    scenario('form-post', '/herd/mammoth-042/edit', method='POST',
+             body=urlencode({
+                 'form.name': 'Manfred',
+                 'form.size': '42',
+                 'form.actions.save': 'Save'}).encode('ascii'),
+             content_type='application/x-www-form-urlencoded',
+             status=303),
+    scenario('json', '/herd/names'),
+    scenario('xmlrpc', '/herd', method='POST', body=XMLRPC_BODY,
+             content_type='text/xml'),
+    scenario('rest', '/++rest++herd/herd/mammoth-042'),
+    scenario('notfound', '/herd/no-such-mammoth', status=404),
+    scenario('error', '/herd/broken', status=500),
+    ]
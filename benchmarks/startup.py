@@ -0,0 +1,73 @@
+"""Compare grok start-up time with a cold and a warm scan cache.
+
+Every run happens in a fresh interpreter, as a real process start-up
+would.  Usage::
+
+  $ python benchmarks/startup.py [--package grok] [--zcml ftesting.zcml]
+                                 [--workers 4]
+"""
+from __future__ import print_function
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+CHILD = """
+import time, warnings
+warnings.simplefilter('ignore')
+import importlib
+from zope.configuration import xmlconfig
+package = importlib.import_module(%(package)r)
+start = time.time()
+xmlconfig.file(%(zcml)r, package=package)
+print(time.time() - start)
+"""
+
+
+def run(package, zcml, cache_dir=None, workers=0):
+    env = dict(os.environ)
+    env.pop('GROK_SCAN_CACHE', None)
+    env['GROK_SCAN_WORKERS'] = str(workers)
+    if cache_dir is not None:
+        env['GROK_SCAN_CACHE'] = cache_dir
+    output = subprocess.check_output(
+        [sys.executable, '-c', CHILD % dict(package=package, zcml=zcml)],
+        env=env)
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--package', default='grok')
+    parser.add_argument('--zcml', default='ftesting.zcml')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=0)
+    options = parser.parse_args(argv)
+    args = (options.package, options.zcml)
+
+    cache_dir = tempfile.mkdtemp(prefix='grok-scan-cache-')
+    try:
+        uncached = min(run(*args) for i in range(options.repeat))
+        parallel = min(run(*args, workers=options.workers)
+                       for i in range(options.repeat))
+        cold = []
+        for i in range(options.repeat):
+            shutil.rmtree(cache_dir)
+            cold.append(run(*args, cache_dir=cache_dir))
+        warm = min(run(*args, cache_dir=cache_dir)
+                   for i in range(options.repeat))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    print('configuration of %s:%s, best of %d' % (
+        options.package, options.zcml, options.repeat))
+    print('  no cache:   %.3fs' % uncached)
+    if options.workers > 1:
+        print('  %d workers:  %.3fs' % (options.workers, parallel))
+    print('  cold cache: %.3fs' % min(cold))
+    print('  warm cache: %.3fs' % warm)
+
+
+if __name__ == '__main__':
+    main()
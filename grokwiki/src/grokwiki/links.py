@@ -0,0 +1,72 @@
+##############################################################################
+#
+# Copyright (c) 2006 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""The links between the pages of a wiki
+"""
+import persistent
+from BTrees.OOBTree import OOBTree, OOTreeSet
+
+
+class LinkIndex(persistent.Persistent):
+    """Remembers which pages link to which other pages.
+
+    The links are kept in both directions, so that the pages linking to
+    a page are found without looking at any other page.
+    """
+
+    def __init__(self):
+        self.forward = OOBTree()
+        self.backward = OOBTree()
+
+    def links_from(self, name):
+        """The names of the pages the page `name` links to."""
+        return tuple(self.forward.get(name, ()))
+
+    def links_to(self, name):
+        """The names of the pages linking to the page `name`."""
+        return tuple(self.backward.get(name, ()))
+
+    def update(self, name, links):
+        """Set the links of the page `name`.
+
+        Only the links that were added or removed are touched. Returns
+        the names of the pages that are now linked to and were not
+        before.
+        """
+        old = self.forward.get(name)
+        new = set(links)
+        added = new.difference(old or ())
+        removed = set(old or ()).difference(new)
+        if not added and not removed:
+            return added
+        if old is None:
+            old = self.forward[name] = OOTreeSet()
+        for target in removed:
+            old.remove(target)
+            sources = self.backward[target]
+            sources.remove(name)
+            if not sources:
+                del self.backward[target]
+        for target in added:
+            old.insert(target)
+            sources = self.backward.get(target)
+            if sources is None:
+                sources = self.backward[target] = OOTreeSet()
+            sources.insert(name)
+        if not old:
+            del self.forward[name]
+        return added
+
+    def remove(self, name):
+        """Forget the links of the page `name`."""
+        self.update(name, ())
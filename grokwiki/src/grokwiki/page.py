@@ -14,6 +14,9 @@
 """The grok demo wiki
 """
 import re
+import time
+from urllib.parse import quote, urlencode
+
 import grok
 
 from z3c.flashmessage.interfaces import IMessageReceiver
@@ -23,17 +26,50 @@ LINK_PATTERN = re.compile('\[\[(.*?)\]\]')
 find_wiki_links = LINK_PATTERN.findall
 
 
+def prerender(text):
+    """Pre-render the text of a page.
+
+    Returns the names of the pages linked to and the HTML of the text,
+    split at the places where the URL of the wiki goes.
+    """
+    tokens = LINK_PATTERN.split(text)
+    links = tuple(tokens[1::2])
+    segments = [tokens[0]]
+    for link, following in zip(links, tokens[2::2]):
+        segments[-1] += '<a href="'
+        segments.append('/%s">%s</a>%s' % (link, link, following))
+    return links, tuple(segments)
+
+
 class WikiPage(grok.Model):
 
     def __init__(self):
         self.text = u"GROK EMPTY WIKI PAGE. FILL!"
+        self.links, self.segments = prerender(self.text)
+        self.modified = time.time()
+
+    def backlinks(self):
+        """The names of the pages linking to this page."""
+        return self.__parent__.links.links_to(self.__name__)
+
+    def render(self, wiki_url):
+        """The text of the page as HTML."""
+        return wiki_url.join(self.segments)
 
     def update(self, text):
-        links = find_wiki_links(text)
-        for link in links:
-            if link not in self.__parent__:
-                self.__parent__[link] = WikiPage()
+        if text == self.text:
+            return
+        links, segments = prerender(text)
+        wiki = self.__parent__
+        for link in wiki.links.update(self.__name__, links):
+            if link not in wiki:
+                wiki[link] = WikiPage()
         self.text = text
+        self.links = links
+        self.segments = segments
+        self.modified = time.time()
+        wiki.touch(self.__name__, self.modified)
+        grok.notify(grok.ObjectModifiedEvent(self))
 
 
 class Layout(grok.View):
@@ -43,10 +79,8 @@ class Layout(grok.View):
 class Index(grok.View):
 
     def update(self):
-        wiki_url = self.url(self.context.__parent__)
-        self.rendered_text, replacements = (
-            LINK_PATTERN.subn(
-                r'<a href="%s/\1">\1</a>' % wiki_url, self.context.text))
+        self.rendered_text = self.context.render(
+            self.url(self.context.__parent__))
 
 
 class Edit(grok.View):
@@ -62,6 +96,22 @@ class Edit(grok.View):
         self.redirect(self.url(self.context))
 
 
+class Pages(grok.View):
+    """Links to a batch of the pages of the wiki."""
+
+    def update(self):
+        self.wiki_url = self.url(self.context.__parent__)
+        self.names, self.previous, self.next = (
+            self.context.__parent__.batch(
+                self.request.form.get('pages') or None))
+
+    def page_url(self, name):
+        return '%s/%s' % (self.wiki_url, quote(name, safe='@+'))
+
+    def batch_url(self, start):
+        return '%s?%s' % (self.request.getURL(), urlencode({'pages': start}))
+
+
 class Messages(grok.View):
     @property
     def messages(self):
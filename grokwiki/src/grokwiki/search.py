@@ -0,0 +1,56 @@
+##############################################################################
+#
+# Copyright (c) 2006 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Full-text search in the wiki
+"""
+from urllib.parse import urlencode
+
+import grok
+from zope.index.text.parsetree import ParseError
+
+import grokwiki.wiki
+
+
+class Search(grok.View):
+    grok.context(grokwiki.wiki.Wiki)
+
+    size = 20
+
+    def update(self, q=u'', start=u'0'):
+        self.query = q.strip()
+        try:
+            self.start = max(int(start), 0)
+        except ValueError:
+            self.start = 0
+        self.total, self.pages, self.error = 0, [], None
+        if not self.query:
+            return
+        try:
+            self.total, self.pages = self.context.search(
+                self.query, self.start, self.size)
+        except ParseError as error:
+            self.error = str(error)
+
+    @property
+    def previous(self):
+        if self.start:
+            return self.batch_url(max(self.start - self.size, 0))
+
+    @property
+    def next(self):
+        if self.start + self.size < self.total:
+            return self.batch_url(self.start + self.size)
+
+    def batch_url(self, start):
+        return '%s?%s' % (
+            self.url(), urlencode({'q': self.query, 'start': start}))
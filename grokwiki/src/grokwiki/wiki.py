@@ -13,13 +13,88 @@
 ##############################################################################
 """The grok demo wiki
 """
+import heapq
+import itertools
+import operator
+
+from BTrees.OOBTree import OOBTree, OOTreeSet
+from zope import component
+from zope.catalog.catalog import Catalog
+from zope.catalog.interfaces import ICatalog
+from zope.catalog.text import TextIndex
+from zope.intid import IntIds
+from zope.intid.interfaces import IIntIds
 
 import grok
 import grokwiki.page
+from grokwiki.links import LinkIndex
+
+
+def setup_catalog(catalog):
+    catalog['text'] = TextIndex('text')
 
 
 class Wiki(grok.Application, grok.Container):
     """This is Grok's sample wiki application."""
+    grok.local_utility(IntIds, provides=IIntIds)
+    grok.local_utility(Catalog, provides=ICatalog, setup=setup_catalog)
+
+    def __init__(self):
+        super(Wiki, self).__init__()
+        self.links = LinkIndex()
+        self.modified = OOBTree()
+        self.changes = OOTreeSet()
+
+    def touch(self, name, modified):
+        """Remember when the page `name` changed last.
+
+        Pass None as `modified` to forget about the page.
+        """
+        previous = self.modified.get(name)
+        if previous is not None:
+            self.changes.remove((previous, name))
+            del self.modified[name]
+        if modified is not None:
+            self.modified[name] = modified
+            self.changes.insert((modified, name))
+
+    def changed_since(self, since):
+        """The names and modification times of the pages changed since
+        `since`, oldest first.
+        """
+        for modified, name in self.changes.keys((since,)):
+            if modified > since:
+                yield name, modified
+
+    def search(self, text, start=0, size=20):
+        """Search the text of the pages.
+
+        Returns the number of pages found and the pages ranked from
+        `start` to `start + size`, best matches first.
+        """
+        catalog = component.getUtility(ICatalog, context=self)
+        intids = component.getUtility(IIntIds, context=self)
+        scores = catalog['text'].apply(text)
+        ranked = heapq.nlargest(
+            start + size, scores.items(), key=operator.itemgetter(1))
+        return len(scores), [
+            intids.getObject(docid) for docid, score in ranked[start:]]
+
+    def batch(self, start=None, size=20):
+        """A batch of the names of the pages, in alphabetical order.
+
+        Returns the names of at most `size` pages from `start` on, and
+        the names the batches before and after this one start with, if
+        there are any. Only the keys in and next to the batch are read.
+        """
+        data = self._SampleContainer__data
+        names = list(itertools.islice(data.keys(start), size + 1))
+        following = names.pop() if len(names) > size else None
+        previous = None
+        if start is not None:
+            before = data.keys(max=start, excludemax=True)
+            previous = next(iter(before[-size:]), None)
+        return names, previous, following
 
 
 class Index(grok.View):
@@ -44,8 +119,24 @@ class Bonjour(Hello):
         return "Bonjour"
 
 
-@grok.subscribe(Wiki, grok.IObjectAddedEvent)
+@grok.subscribe(Wiki, grok.IApplicationAddedEvent)
 def setupHomepage(wiki, event):
-    """Creates a home page for every wiki."""
+    """Creates a home page for every wiki.
+
+    This waits for the search catalog to be installed, so that the home
+    page is indexed.
+    """
     page = grokwiki.page.WikiPage()
     wiki['home'] = page
+
+
+@grok.subscribe(grokwiki.page.WikiPage, grok.IObjectMovedEvent)
+def indexPage(page, event):
+    """Keeps the link index and the modification times up to date when
+    pages come and go."""
+    if isinstance(event.oldParent, Wiki):
+        event.oldParent.links.remove(event.oldName)
+        event.oldParent.touch(event.oldName, None)
+    if isinstance(event.newParent, Wiki):
+        event.newParent.links.update(event.newName, page.links)
+        event.newParent.touch(event.newName, page.modified)
@@ -13,9 +13,19 @@
 ##############################################################################
 """XML/RPC access to the wiki pages
 """
+import xmlrpc.client
 
 import grok
+import transaction
+from zope import component
+from zope.publisher.interfaces.xmlrpc import IXMLRPCRequest
+from zope.security.checker import ProxyFactory
+
 import grokwiki.page
+import grokwiki.wiki
+
+# The changes to this many pages are written to a savepoint at once.
+CHUNK_SIZE = 500
 
 
 class WikiPageRPC(grok.XMLRPC):
@@ -26,3 +36,86 @@ class WikiPageRPC(grok.XMLRPC):
 
     def show(self):
         return self.context.text
+
+
+class WikiRPC(grok.XMLRPC):
+    grok.context(grokwiki.wiki.Wiki)
+
+    def show_many(self, names):
+        """The text of the named pages. Missing pages are left out."""
+        pages = {}
+        for name in names:
+            page = self.context.get(name)
+            if page is not None:
+                pages[name] = page.text
+        return pages
+
+    def edit_many(self, texts):
+        """Change the text of many pages, creating the missing ones."""
+        for count, name in enumerate(sorted(texts), 1):
+            page = self.context.get(name)
+            if page is None:
+                page = self.context[name] = grokwiki.page.WikiPage()
+            page.update(texts[name])
+            if not count % CHUNK_SIZE:
+                transaction.savepoint(optimistic=True)
+        return len(texts)
+
+    def list_pages(self, since=0):
+        """The names and modification times of the pages changed since
+        `since` seconds after the epoch, oldest first."""
+        return [[name, modified]
+                for name, modified in self.context.changed_since(since)]
+
+
+class System(grok.Model):
+    """The object behind the ``system.*`` methods of a wiki."""
+
+
+class WikiTraverser(grok.Traverser):
+    grok.context(grokwiki.wiki.Wiki)
+    grok.layer(IXMLRPCRequest)
+
+    def traverse(self, name):
+        if name == 'system':
+            return System()
+
+
+class SystemRPC(grok.XMLRPC):
+    grok.context(System)
+
+    def multicall(self, calls):
+        """Make several calls on the wiki in one request.
+
+        Every call is a struct with a ``methodName`` and ``params``. The
+        result of a call is wrapped in a list. A failing call results in
+        a fault struct instead, and its changes are undone.
+        """
+        results = []
+        for call in calls:
+            savepoint = transaction.savepoint(optimistic=True)
+            try:
+                results.append([self.call(
+                    call['methodName'], call.get('params', ()))])
+            except Exception as error:
+                savepoint.rollback()
+                if not isinstance(error, xmlrpc.client.Fault):
+                    error = xmlrpc.client.Fault(
+                        -32500, '%s: %s' % (error.__class__.__name__, error))
+                results.append({'faultCode': error.faultCode,
+                                'faultString': error.faultString})
+        return results
+
+    def call(self, name, params):
+        if name == 'system.multicall':
+            raise xmlrpc.client.Fault(
+                -32600, 'system.multicall cannot be nested')
+        path = name.split('.')
+        obj = self.context.__parent__
+        for step in path[:-1]:
+            obj = obj[step]
+        method = component.queryMultiAdapter(
+            (obj, self.request), name=path[-1])
+        if method is None:
+            raise xmlrpc.client.Fault(-32601, 'Unknown method %s' % name)
+        return ProxyFactory(method)(*params)
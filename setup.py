@@ -75,6 +75,7 @@ setup(
         'martian >= 1.2',
         'pytz',
         'setuptools',
+        'transaction',
         'z3c.autoinclude',
         'zc.catalog',
         'ZODB',
@@ -86,6 +87,7 @@ setup(
         'zope.catalog',
         'zope.component',
         'zope.container',
+        'zope.contenttype',
         'zope.contentprovider',
         'zope.errorview [browser]',
         'zope.event',
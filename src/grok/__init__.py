@@ -12,7 +12,14 @@
 #
 ##############################################################################
 """Grok
+
+Importing grok gives access to the complete Grok API.  The components
+from most grokcore packages are only imported the first time they are
+looked up on this module, so that ``import grok`` itself stays cheap.
 """
+import importlib
+import sys
+
 from zope.component import adapts
 
 from martian import ClassGrokker, InstanceGrokker, GlobalGrokker
@@ -52,40 +59,8 @@ from grokcore.view import skin
 from grokcore.view import url
 from grokcore.view import path
 
-from grokcore.viewlet import Viewlet
-from grokcore.viewlet import ViewletManager
-from grokcore.viewlet import view
-from grokcore.viewlet import viewletmanager
-from grokcore.viewlet import order
-
-from grokcore.formlib import action
-from grokcore.formlib import AutoFields
-from grokcore.formlib import Fields
-
-from grokcore.layout.interfaces import ILayout
-from grokcore.layout import UnauthorizedPage
-from grokcore.layout import NotFoundPage
-from grokcore.layout import ExceptionPage
-from grokcore.layout import layout
-
-from grokcore.annotation import Annotation
-from grokcore.annotation import queryAnnotation
-from grokcore.annotation import deleteAnnotation
-from grokcore.annotation import LazyAnnotation
-from grokcore.annotation import LazyAnnotationProperty
-
-from grokcore.site import IApplication
-from grokcore.site import IApplicationAddedEvent
-from grokcore.site import Application
-from grokcore.site import ApplicationAddedEvent
-from grokcore.site import getApplication
-from grokcore.site import getSite
-from grokcore.site import local_utility
-from grokcore.site import install_on
-from grokcore.site import LocalUtility
-from grokcore.site import site
-from grokcore.site import Site
-from grokcore.site.util import create_application
+from grok.directive import cache, conditional
+from grok.container import BTreeOrderedContainer, bulk_add, deferred_add
 
 from zope.event import notify
 
@@ -113,44 +88,69 @@ from grokcore.content import ObjectModifiedEvent
 from grokcore.content import ContainerModifiedEvent
 from grokcore.content import ObjectEditedEvent
 
-from grok.components import AddForm
-from grok.components import AddFormPage
-from grok.components import DisplayForm
-from grok.components import DisplayFormPage
-from grok.components import EditForm
-from grok.components import EditFormPage
-from grok.components import ExceptionView
-from grok.components import Form
-from grok.components import FormPage
-from grok.components import Layout
-from grok.components import NotFoundView
-from grok.components import Page
-from grok.components import UnauthorizedView
-from grok.components import View
-
-from grok.interfaces import IDatabaseCreatedEvent
-from grok.events import DatabaseCreatedEvent
-
-from grokcore.json import JSON
-from grokcore.xmlrpc import XMLRPC
-
-from grokcore.catalog import Indexes
-from grokcore.catalog import index
-
-from grokcore.traverser import Traverser
-from grokcore.traverser import traversable
-
-from grokcore.rest import IRESTLayer
-from grokcore.rest import IRESTSkinType
-from grokcore.rest import REST
-from grokcore.rest import restskin
-
 # BBB These two functions are meant for test fixtures and should be
 # imported from grok.testing, not from grok.
 from grok.testing import grok, grok_component
 
-# Our __init__ provides the grok API directly so using 'import grok' is enough.
-from grok.interfaces import IGrokAPI
-from zope.interface import moduleProvides
-moduleProvides(IGrokAPI)
-__all__ = list(IGrokAPI)
+# The rest of the API is imported lazily, see __getattr__ below.
+_lazy_imports = {}
+
+
+def _lazy(module_name, *names):
+    for name in names:
+        _lazy_imports[name] = module_name
+
+
+_lazy('grokcore.viewlet', 'ViewletManager', 'view', 'viewletmanager', 'order')
+_lazy('grokcore.formlib', 'action', 'AutoFields', 'Fields')
+_lazy('grokcore.layout.interfaces', 'ILayout')
+_lazy('grokcore.layout',
+      'UnauthorizedPage', 'NotFoundPage', 'ExceptionPage', 'layout')
+_lazy('grokcore.annotation',
+      'Annotation', 'queryAnnotation', 'deleteAnnotation',
+      'LazyAnnotation', 'LazyAnnotationProperty')
+_lazy('grokcore.site',
+      'IApplication', 'IApplicationAddedEvent', 'Application',
+      'ApplicationAddedEvent', 'getApplication', 'getSite',
+      'local_utility', 'install_on', 'LocalUtility', 'site', 'Site')
+_lazy('grokcore.site.util', 'create_application')
+_lazy('grok.components',
+      'AddForm', 'AddFormPage', 'ContainerListing', 'DisplayForm',
+      'DisplayFormPage', 'EditForm', 'EditFormPage', 'ExceptionView',
+      'Form', 'FormPage', 'Layout', 'NotFoundView', 'Page',
+      'UnauthorizedView', 'View', 'Viewlet')
+_lazy('grok.interfaces', 'IDatabaseCreatedEvent', 'IGrokAPI')
+_lazy('grok.events', 'DatabaseCreatedEvent')
+_lazy('grokcore.json', 'JSON')
+_lazy('grokcore.xmlrpc', 'XMLRPC')
+_lazy('grokcore.catalog', 'Indexes', 'index')
+_lazy('grokcore.traverser', 'Traverser', 'traversable')
+_lazy('grokcore.rest', 'IRESTLayer', 'IRESTSkinType', 'REST', 'restskin')
+
+
+def _provide_api():
+    # Our __init__ provides the grok API directly so using 'import grok'
+    # is enough.  Declaring this needs the interfaces of all grokcore
+    # packages, so it is only done on demand as well.
+    from grok.interfaces import IGrokAPI
+    from zope.interface import directlyProvides
+    module = sys.modules[__name__]
+    directlyProvides(module, IGrokAPI)
+    module.__all__ = list(IGrokAPI)
+
+
+def __getattr__(name):
+    module_name = _lazy_imports.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name), name)
+        globals()[name] = value
+        return value
+    if name in ('__all__', '__provides__'):
+        _provide_api()
+        return globals()[name]
+    raise AttributeError(
+        "module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
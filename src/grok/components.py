@@ -43,7 +43,10 @@ import grokcore.site
 import grokcore.message
 import grokcore.layout
 import grokcore.layout.components
-from grok import interfaces, util
+import grokcore.viewlet
+from grok import interfaces, rendercache, streaming, util
+from grok.container import Batch
+from grok.directive import conditional
 
 # BBB this is for import backward compatibility.
 from grokcore.xmlrpc import XMLRPC
@@ -66,6 +69,29 @@ class ViewSupportMixin(object):
         return util.application_url(
             self.request, self.context, name=name, skin=skin, data=data)
 
+    def url(self, obj=None, name=None, skin=ASIS, data=None):
+        """Return string for the URL based on the obj and name.
+
+        See :meth:`grokcore.view.components.ViewSupport.url`.  URLs are
+        computed once per request.
+        """
+        if isinstance(obj, str):
+            if name is not None:
+                raise TypeError(
+                    'url() takes either obj argument, obj, string arguments, '
+                    'or string argument')
+            name = obj
+            obj = None
+
+        if name is None and obj is None:
+            # create URL to view itself
+            obj = self
+        elif name is not None and obj is None:
+            # create URL to view on context
+            obj = self.context
+
+        return util.cached_url(self.request, obj, name, skin, data)
+
     def flash(self, message, type='message'):
         """Send a short message to the user."""
         grokcore.message.send(message, type=type, name='session')
@@ -144,9 +170,38 @@ class View(ViewSupportMixin, grokcore.view.View):
     `update()` methods will find the context for which the view is being
     rendered under ``self.context``.
 
+    A `render()` method may also return an iterator, such as a
+    generator, instead of a string.  The chunks it produces are then
+    sent to the user one by one, as they are produced, which helps when
+    rendering large listings or exports (see :mod:`grok.streaming`).
+
+    Views whose output only changes when their context changes can use
+    the `grok.conditional()` directive.  Their responses then carry an
+    ``ETag`` and a ``Last-Modified`` header, and a request for which the
+    user already has the current version is answered with ``304 Not
+    Modified`` without calling `update()` or `render()`.
+
     """
     grok.baseclass()
 
+    def __call__(self):
+        validators = None
+        if conditional.bind().get(self):
+            validators = util.validators(self)
+        if validators is not None:
+            if util.not_modified(self.request, *validators):
+                # Don't update or render anything.
+                self.response.setStatus(304)
+                return
+        key, result = rendercache.lookup(self, *self._cache_extra())
+        if result is None:
+            result = rendercache.store(
+                self, key, super(View, self).__call__())
+        if (validators is not None and
+                self.response.getStatus() not in (302, 303)):
+            util.set_validators(self.response, *validators)
+        return streaming.stream(self.request, result)
+
     def application_url(self, name=None, skin=ASIS, data=None):
         """Return the URL of the closest :class:`grok.Application` object in
         the hierarchy or the URL of a named object (``name``
@@ -159,6 +214,60 @@ class View(ViewSupportMixin, grokcore.view.View):
         """Send a short message to the user."""
         grokcore.message.send(message, type=type, name='session')
 
+    def _cache_extra(self):
+        # What the cached output depends on besides the context.
+        return ()
+
+
+class ContainerListing(View):
+    """Base class for views listing the items of a container in batches.
+
+    The items to show are in `batch`, a :class:`grok.container.Batch` of
+    at most `batch_size` items, that starts at the item the ``cursor``
+    request variable points to.  `next_url()` is the URL of the view
+    showing the following batch, if there is one, and `first_url()` is
+    the URL of the first one.  Listing a batch only loads the items in
+    it, however large the container is.
+
+    When a listing uses the `grok.cache()` directive, its output is
+    cached per batch for as long as the same items with the same
+    committed changes are in the batch.
+    """
+    grok.baseclass()
+
+    batch_size = 20
+    _batch = None
+
+    @property
+    def batch(self):
+        if self._batch is None:
+            cursor = self.request.form.get('cursor')
+            try:
+                self._batch = Batch(self.context, cursor, self.batch_size)
+            except ValueError:
+                # Start over rather than fail on a garbled cursor.
+                self._batch = Batch(self.context, None, self.batch_size)
+        return self._batch
+
+    def next_url(self):
+        """Return the URL of the following batch or None."""
+        if self.batch.next is None:
+            return None
+        return self.url(data={'cursor': self.batch.next})
+
+    def first_url(self):
+        """Return the URL of the first batch."""
+        return self.url()
+
+    def _cache_extra(self):
+        serials = []
+        for key, item in self.batch.items():
+            if getattr(item, '_p_jar', None) is not None:
+                # A ghost does not know its serial yet.
+                item._p_activate()
+            serials.append((key, getattr(item, '_p_serial', None)))
+        return (self.batch.cursor, tuple(serials))
+
 
 class ExceptionView(View, zope.errorview.browser.ExceptionView):
     """Base class for rendering views for uncaught exceptions that occur during
@@ -275,12 +384,63 @@ class EditForm(ViewSupportMixin, grokcore.formlib.EditForm):
     grok.baseclass()
 
 
+class LayoutStreamingMixin(object):
+    """Stream the chunks of an iterator returned by `render()` in place
+    of the content rendered by the layout.
+    """
+    _chunks = None
+
+    def content(self):
+        content = super(LayoutStreamingMixin, self).content()
+        if streaming.is_stream(content):
+            self._chunks = content
+            return streaming.MARKER
+        return content
+
+    def _stream_layout(self, rendered):
+        if rendered is None or self._chunks is None:
+            return rendered
+        return streaming.StreamResult(
+            self.request, streaming.in_layout(rendered, self._chunks))
+
+
 class Layout(ViewSupportMixin, grokcore.layout.Layout):
     grok.baseclass()
 
-class Page(ViewSupportMixin, grokcore.layout.Page):
+class Page(
+    ViewSupportMixin,
+    LayoutStreamingMixin,
+    grokcore.layout.Page
+    ):
     grok.baseclass()
 
+    def __call__(self):
+        key, result = rendercache.lookup(self)
+        if result is None:
+            result = rendercache.store(
+                self, key, super(Page, self).__call__())
+        return self._stream_layout(result)
+
+
+class Viewlet(grokcore.viewlet.Viewlet):
+    """Base class for viewlets in Grok applications.
+
+    Viewlets using the `grok.cache()` directive are neither updated nor
+    rendered as long as their output is cached.
+    """
+    grok.baseclass()
+
+    def __init__(self, context, request, view, manager):
+        super(Viewlet, self).__init__(context, request, view, manager)
+        key, output = rendercache.lookup(
+            self, view.__class__, getattr(manager, '__name__', None))
+        if output is not None:
+            self.update = lambda: None
+            self.render = lambda: output
+        elif key is not None:
+            render = self.render
+            self.render = lambda: rendercache.store(self, key, render())
+
 # Default forms for form without the html and body tags
 default_form_template = grokcore.view.PageTemplateFile(
     os.path.join('templates', 'default_edit_form.pt'))
@@ -292,24 +452,42 @@ default_display_template = grokcore.view.PageTemplateFile(
 
 default_display_template.__grok_name__ = 'default_display_form'
 
-class LayoutAwareFormPage(grokcore.layout.components.LayoutAware):
+class LayoutAwareFormPage(
+    LayoutStreamingMixin,
+    grokcore.layout.components.LayoutAware
+    ):
     """A mixin to make form aware of layouts.
+
+    The layout is only looked up when it is needed, which for a form
+    that redirects after processing its input is never.
     """
+    _layout = None
+
+    @property
+    def layout(self):
+        if self._layout is None:
+            self._layout = self._get_layout()
+        return self._layout
+
+    @layout.setter
+    def layout(self, layout):
+        self._layout = layout
+
     def __call__(self):
         """Calls update and returns the layout template which calls render.
         """
-        self.layout = self._get_layout()
+        response = self.request.response
         mapply(self.update, (), self.request)
-        if self.request.response.getStatus() in (302, 303):
+        if response.getStatus() in (302, 303):
             # A redirect was triggered somewhere in update().  Don't
             # continue rendering the template or doing anything else.
             return
         # update_form() is what make a layout-aware form different from
         # 'regular" layout-aware component.
         self.update_form()
-        if self.request.response.getStatus() in (302, 303):
+        if response.getStatus() in (302, 303):
             return
-        return self.layout(self)
+        return self._stream_layout(self.layout(self))
 
 
 class FormPage(
@@ -0,0 +1,293 @@
+##############################################################################
+#
+# Copyright (c) 2006-2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Helpers for working with many items of a container.
+"""
+import base64
+import binascii
+import contextlib
+import itertools
+
+import grokcore.content
+from BTrees.LOBTree import LOBTree
+from BTrees.OOBTree import OOBTree
+from zope.container.btree import BTreeContainer
+from zope.container.contained import (
+    checkAndConvertName, containedEvent, notifyContainerModified)
+from zope.container.interfaces import IOrderedContainer
+from zope.event import notify
+from zope.interface import implementer
+
+# The distance between the positions of items added or renumbered.
+POSITION_STEP = 2 ** 16
+# The smallest distance left between items that are spread out to make
+# room for an item moved in between.
+MINIMUM_STEP = 2 ** 8
+
+
+def bulk_add(container, items):
+    """Add many items to `container` at once.
+
+    `items` is a mapping or a sequence of ``(name, object)`` pairs.  All
+    objects are stored before any event is sent.  Then the usual
+    ``IObjectAddedEvent`` (or ``IObjectMovedEvent``) is sent for every
+    object, in order, and a single ``IContainerModifiedEvent`` for the
+    container.  Nothing is added if one of the names is invalid or
+    taken.
+    """
+    if hasattr(items, 'items'):
+        items = items.items()
+    added = {}
+    for name, ob in items:
+        name = checkAndConvertName(name)
+        if name in added or name in container:
+            raise KeyError(name)
+        added[name] = ob
+
+    events = []
+    contained = {}
+    for name, ob in added.items():
+        ob, event = containedEvent(ob, container, name)
+        contained[name] = ob
+        if event:
+            events.append(event)
+
+    if (isinstance(container, BTreeContainer) and
+            type(container)._setitemf is BTreeContainer._setitemf):
+        # One pass over the BTree and a single change of the length.
+        length = container._BTreeContainer__len
+        container._SampleContainer__data.update(contained)
+        length.change(len(contained))
+    else:
+        for name, ob in contained.items():
+            container._setitemf(name, ob)
+    if isinstance(container, grokcore.content.OrderedContainer):
+        container._order.extend(contained)
+
+    for event in events:
+        notify(event)
+    if events:
+        notifyContainerModified(container)
+    return list(contained)
+
+
+@contextlib.contextmanager
+def deferred_add(container):
+    """Collect the items to add to `container` and add them at once.
+
+    Within the ``with`` block, items are put into the dictionary this
+    returns.  They are added with :func:`bulk_add` when the block ends
+    without an exception.
+    """
+    items = {}
+    yield items
+    bulk_add(container, items)
+
+
+@implementer(IOrderedContainer)
+class BTreeOrderedContainer(grokcore.content.Container):
+    """A Grok container that keeps the order of its items in BTrees.
+
+    Like `grok.OrderedContainer`, it remembers the order in which items
+    were inserted.  Every item has a numeric position, with room left
+    between the positions of neighbouring items.  Adding, removing and
+    moving an item therefore changes only a few BTree buckets instead
+    of the whole order, which makes large ordered containers practical.
+    Use `move()` to move a single item and `updateOrder()` to impose a
+    complete new order.
+    """
+
+    def __init__(self):
+        super(BTreeOrderedContainer, self).__init__()
+        self._positions = OOBTree()
+        self._order = LOBTree()
+
+    def keys(self):
+        return list(self._order.values())
+
+    def __iter__(self):
+        return iter(self._order.values())
+
+    def values(self):
+        return (self[key] for key in self._order.values())
+
+    def items(self):
+        return ((key, self[key]) for key in self._order.values())
+
+    def _setitemf(self, key, value):
+        super(BTreeOrderedContainer, self)._setitemf(key, value)
+        self._place(key, self._end())
+
+    def __delitem__(self, key):
+        del self._order[self._positions.pop(key)]
+        super(BTreeOrderedContainer, self).__delitem__(key)
+
+    def _end(self):
+        if not self._order:
+            return 0
+        return self._order.maxKey() + POSITION_STEP
+
+    def _place(self, key, position):
+        previous = self._positions.get(key)
+        if previous is not None:
+            del self._order[previous]
+        self._positions[key] = position
+        self._order[position] = key
+
+    def _renumber(self, order):
+        self._positions.clear()
+        self._order.clear()
+        for index, key in enumerate(order):
+            self._place(key, index * POSITION_STEP)
+
+    def move(self, key, before=None):
+        """Move the item `key` in front of the item `before`.
+
+        The item is moved to the end if `before` is None.
+        """
+        position = self._positions[key]
+        if before is None:
+            if position != self._order.maxKey():
+                self._place(key, self._end())
+                notifyContainerModified(self)
+            return
+        if before == key:
+            return
+        next_position = self._positions[before]
+        try:
+            previous = self._order.maxKey(next_position - 1)
+        except ValueError:
+            new = next_position - POSITION_STEP
+        else:
+            if previous == position:
+                return
+            new = (previous + next_position) // 2
+            if new == previous:
+                # There is no room left between the two neighbours.
+                self._spread(key, previous)
+                notifyContainerModified(self)
+                return
+        self._place(key, new)
+        notifyContainerModified(self)
+
+    def _spread(self, key, previous):
+        # Put `key` right after the position `previous`, spreading out as
+        # few of the following items as needed to leave some room again.
+        del self._order[self._positions.pop(key)]
+        following = []
+        for position, name in self._order.items(previous, excludemin=True):
+            step = (position - previous) // (len(following) + 2)
+            if step >= MINIMUM_STEP:
+                break
+            following.append(name)
+        else:
+            step = POSITION_STEP
+        for name in following:
+            del self._order[self._positions.pop(name)]
+        for index, name in enumerate([key] + following):
+            self._place(name, previous + (index + 1) * step)
+
+    def updateOrder(self, order):
+        """Impose a new order on the items in this container.
+
+        `order` must contain every key of the container once.
+        """
+        if not isinstance(order, (tuple, list)):
+            raise TypeError('order must be a tuple or a list.')
+        if (len(order) != len(self._positions) or
+                set(order) != set(self._positions.keys())):
+            raise ValueError("Incompatible key set.")
+        self._renumber(order)
+        notifyContainerModified(self)
+
+
+def _encode_cursor(container, position, key):
+    if isinstance(container, BTreeOrderedContainer):
+        return 'p%d' % position
+    return 'k' + base64.urlsafe_b64encode(
+        key.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(container, cursor):
+    kind, value = cursor[:1], cursor[1:]
+    if isinstance(container, BTreeOrderedContainer):
+        if kind == 'p':
+            return int(value)
+    elif kind == 'k':
+        try:
+            return base64.urlsafe_b64decode(
+                value + '=' * (-len(value) % 4)).decode('utf-8')
+        except (TypeError, binascii.Error, UnicodeDecodeError):
+            pass
+    raise ValueError('Invalid cursor %r.' % cursor)
+
+
+def _keys_from(container, start):
+    # Return an iterator over the positions and keys of the items of
+    # `container`, from the item at `start` on.
+    if isinstance(container, BTreeOrderedContainer):
+        return iter(container._order.items(start))
+    if isinstance(container, BTreeContainer):
+        keys = container._SampleContainer__data.keys(start)
+        return ((None, key) for key in keys)
+    # Other containers have no ordered index to start from.
+    keys = iter(container.keys())
+    if start is not None:
+        keys = itertools.dropwhile(lambda key: key != start, keys)
+    return ((None, key) for key in keys)
+
+
+class Batch(object):
+    """A batch of at most `size` items of `container`.
+
+    The batch starts at the item `cursor` points to, or at the first
+    item if `cursor` is None.  Cursors are opaque strings, the one of
+    the following batch is `next`.  Only the keys of the batch are
+    read from the container, in order of the keys, or in the order of
+    the items for a `grok.BTreeOrderedContainer`.  For these and other
+    BTree based containers, getting a batch costs the same wherever it
+    starts.  The items themselves are only loaded when they are used.
+
+    A `ValueError` is raised for a cursor that was not made for this
+    kind of container.
+    """
+
+    def __init__(self, container, cursor=None, size=20):
+        self.container = container
+        self.cursor = cursor
+        self.size = size
+        start = None
+        if cursor is not None:
+            start = _decode_cursor(container, cursor)
+        found = list(itertools.islice(
+            _keys_from(container, start), size + 1))
+        self.next = None
+        if len(found) > size:
+            position, key = found.pop()
+            self.next = _encode_cursor(container, position, key)
+        self._keys = [key for position, key in found]
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return self.values()
+
+    def keys(self):
+        return list(self._keys)
+
+    def values(self):
+        return (self.container[key] for key in self._keys)
+
+    def items(self):
+        return ((key, self.container[key]) for key in self._keys)
@@ -0,0 +1,52 @@
+##############################################################################
+#
+# Copyright (c) 2006-2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Grok directives.
+"""
+import martian
+from martian.error import GrokImportError
+
+
+class conditional(martian.Directive):
+    """Answer conditional GET requests for a view.
+
+    The validators are computed from the last committed change of the
+    view's context.
+    """
+    scope = martian.CLASS
+    store = martian.ONCE
+    default = False
+
+    def factory(self, value=True):
+        return bool(value)
+
+
+class cache(martian.Directive):
+    """Cache the output of a view, page or viewlet.
+
+    ``maxage`` is the number of seconds the output is kept at most,
+    ``vary`` names the request variables (such as form fields, cookies
+    or environment variables) the output depends on.
+    """
+    scope = martian.CLASS
+    store = martian.ONCE
+    default = None
+
+    def factory(self, maxage=None, vary=()):
+        if maxage is not None and not isinstance(maxage, (int, float)):
+            raise GrokImportError(
+                "The 'maxage' argument of the '%s' directive must be a "
+                "number." % self.name)
+        if isinstance(vary, str):
+            vary = (vary,)
+        return maxage, tuple(vary)
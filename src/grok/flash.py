@@ -0,0 +1,82 @@
+##############################################################################
+#
+# Copyright (c) 2006-2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Flash messages that only touch the session when there are any.
+
+The messages sent with ``flash()`` are kept in the session of the user,
+like with the session source of grokcore.message.  Sending a message
+also sets a marker cookie, which is expired again once all messages
+have been received.  Requests without the marker cookie never look at
+the session, so rendering the messages of a page without any costs no
+session reads or writes.
+"""
+import persistent.list
+import zope.security.management
+from z3c.flashmessage.sources import SessionMessageSource as BaseSource
+from zope.session.interfaces import ISession
+
+COOKIE = 'grok.flash'
+PENDING_KEY = 'grok.flash.pending'
+
+
+def _request():
+    return zope.security.management.getInteraction().participations[0]
+
+
+def has_messages(request):
+    """Tell whether there may be flash messages for the user."""
+    return bool(request.annotations.get(PENDING_KEY) or
+                request.getCookies().get(COOKIE))
+
+
+class SessionMessageSource(BaseSource):
+    """Message source that keeps its messages in the session.
+
+    Unlike its base class, it only reads the session if a message was
+    sent to the user before.
+    """
+
+    def send(self, message, type='message'):
+        super(SessionMessageSource, self).send(message, type)
+        request = _request()
+        request.annotations[PENDING_KEY] = True
+        request.response.setCookie(COOKIE, '1', path='/')
+
+    def list(self, type=None):
+        request = _request()
+        if not has_messages(request):
+            return iter(())
+        if not self._get_storage():
+            # The messages are gone, with an expired session for instance.
+            self._received(request)
+            return iter(())
+        return super(SessionMessageSource, self).list(type)
+
+    def delete(self, message):
+        super(SessionMessageSource, self).delete(message)
+        if not self._get_storage():
+            self._received(_request())
+
+    def _received(self, request):
+        request.annotations[PENDING_KEY] = False
+        request.response.expireCookie(COOKIE, path='/')
+
+    def _get_storage(self, for_write=False):
+        session = ISession(_request())
+        if for_write:
+            return session[self._pkg_id].setdefault(
+                'messages', persistent.list.PersistentList())
+        session_data = session.get(self._pkg_id)
+        if session_data is None:
+            return ()
+        return session_data.get('messages', ())
@@ -0,0 +1,213 @@
+"""
+Views, pages and viewlets using the ``grok.cache()`` directive are only
+rendered once for the same state of their context::
+
+  >>> import transaction
+  >>> from grok.rendercache import render_cache
+  >>> getRootFolder()['manfred'] = manfred = Mammoth()
+  >>> transaction.commit()
+
+  >>> from zope.testbrowser.wsgi import Browser
+  >>> browser = Browser()
+  >>> browser.handleErrors = False
+  >>> browser.open('http://localhost/manfred')
+  >>> print(browser.contents)
+  Manfred is 3 meters tall.
+  >>> browser.open('http://localhost/manfred')
+  >>> print(browser.contents)
+  Manfred is 3 meters tall.
+  >>> rendered
+  ['index']
+  >>> browser.headers['Content-Type']
+  'text/plain;charset=utf-8'
+
+Committing a change to the context changes its serial, so the view is
+rendered again::
+
+  >>> manfred.height = 4
+  >>> transaction.commit()
+  >>> browser.open('http://localhost/manfred')
+  >>> print(browser.contents)
+  Manfred is 4 meters tall.
+  >>> rendered
+  ['index', 'index']
+
+Modifying the context drops its entries from the cache right away::
+
+  >>> len(render_cache)
+  2
+  >>> from zope.lifecycleevent import modified
+  >>> modified(manfred)
+  >>> len(render_cache)
+  0
+
+Views can name request variables their output depends on::
+
+  >>> del rendered[:]
+  >>> browser.open('http://localhost/manfred/greeting?lang=en')
+  >>> print(browser.contents)
+  Hello Manfred
+  >>> browser.open('http://localhost/manfred/greeting?lang=de')
+  >>> print(browser.contents)
+  Hallo Manfred
+  >>> browser.open('http://localhost/manfred/greeting?lang=en')
+  >>> print(browser.contents)
+  Hello Manfred
+  >>> rendered
+  ['greeting', 'greeting']
+
+Redirects are not cached::
+
+  >>> browser.open('http://localhost/manfred/moved')
+  >>> browser.open('http://localhost/manfred/moved')
+  >>> browser.url
+  'http://localhost/manfred'
+  >>> rendered
+  ['greeting', 'greeting', 'moved', 'index', 'moved']
+
+Pages are cached including their layout, viewlets without their view::
+
+  >>> del rendered[:]
+  >>> browser.open('http://localhost/manfred/page')
+  >>> print(browser.contents)
+  <html><body><div>Manfred is 4 meters tall.</div>
+  <p>Tusks</p></body></html>
+  >>> browser.open('http://localhost/manfred/page')
+  >>> rendered
+  ['tusks', 'page']
+  >>> browser.open('http://localhost/manfred/other')
+  >>> print(browser.contents)
+  <p>Tusks</p>
+  >>> rendered
+  ['tusks', 'page', 'other', 'tusks']
+  >>> browser.open('http://localhost/manfred/other')
+  >>> rendered
+  ['tusks', 'page', 'other', 'tusks', 'other']
+
+Objects that are not persistent or not committed yet are not cached::
+
+  >>> del rendered[:]
+  >>> getRootFolder()['ellie'] = Mammoth()
+  >>> from zope.publisher.browser import TestRequest
+  >>> from zope.component import getMultiAdapter
+  >>> view = getMultiAdapter(
+  ...     (getRootFolder()['ellie'], TestRequest()), name='index')
+  >>> print(view())
+  Manfred is 3 meters tall.
+  >>> print(view())
+  Manfred is 3 meters tall.
+  >>> rendered
+  ['index', 'index']
+
+The cache is bounded in size and evicts the least recently used entries
+first. Entries can expire after a number of seconds::
+
+  >>> from grok.rendercache import RenderCache
+  >>> cache = RenderCache(10)
+  >>> cache.set(('db', 1, 'a'), 'aaaa', 4)
+  >>> cache.set(('db', 2, 'b'), 'bbbb', 4)
+  >>> cache.get(('db', 1, 'a'))
+  'aaaa'
+  >>> cache.set(('db', 3, 'c'), 'cccc', 4)
+  >>> cache.get(('db', 2, 'b')) is None
+  True
+  >>> cache.get(('db', 1, 'a'))
+  'aaaa'
+  >>> cache.size
+  8
+  >>> cache.set(('db', 4, 'd'), 'dddd', 4, maxage=-1)
+  >>> cache.get(('db', 4, 'd')) is None
+  True
+  >>> cache.hits, cache.misses
+  (2, 2)
+
+"""
+import grok
+from zope.component import getMultiAdapter
+from zope.interface import Interface
+
+rendered = []
+
+
+class Mammoth(grok.Model):
+    height = 3
+
+
+class Index(grok.View):
+    grok.cache()
+
+    def update(self):
+        self.response.setHeader('Content-Type', 'text/plain;charset=utf-8')
+
+    def render(self):
+        rendered.append('index')
+        return 'Manfred is %s meters tall.' % self.context.height
+
+
+class Greeting(grok.View):
+    grok.cache(maxage=60, vary='lang')
+
+    def render(self, lang):
+        rendered.append('greeting')
+        return {'en': 'Hello Manfred', 'de': 'Hallo Manfred'}[lang]
+
+
+class Moved(grok.View):
+    grok.cache()
+
+    def update(self):
+        rendered.append('moved')
+        self.redirect(self.url(self.context))
+
+    def render(self):
+        return 'Moved'
+
+
+class Master(grok.Layout):
+    grok.context(Mammoth)
+
+    def render(self):
+        return '<html><body><div>%s</div>\n%s</body></html>' % (
+            self.view.content(), self.view.tusks)
+
+
+class Page(grok.Page):
+    grok.cache()
+
+    def update(self):
+        self.tusks = getMultiAdapter(
+            (self.context, self.request, self), name='tusks')()
+
+    def render(self):
+        rendered.append('page')
+        return 'Manfred is %s meters tall.' % self.context.height
+
+
+class Other(grok.View):
+
+    def render(self):
+        rendered.append('other')
+        manager = getMultiAdapter(
+            (self.context, self.request, self), name='tusks')
+        return manager()
+
+
+class Tusks(grok.ViewletManager):
+    grok.context(Mammoth)
+    grok.view(Interface)
+
+    def __call__(self):
+        self.update()
+        return self.render()
+
+
+class Tusk(grok.Viewlet):
+    grok.context(Mammoth)
+    grok.viewletmanager(Tusks)
+    grok.view(Interface)
+    grok.cache()
+
+    def render(self):
+        rendered.append('tusks')
+        return '<p>Tusks</p>'
+
@@ -0,0 +1,113 @@
+"""
+In queued mode, the catalog updates of a transaction are collected and
+applied just before it is committed::
+
+  >>> import transaction
+  >>> from grok import indexing
+  >>> indexing.enable_queue()
+
+  >>> root = getRootFolder()
+  >>> root['zoo'] = zoo = Zoo()
+  >>> transaction.commit()
+  >>> from zope.component.hooks import setSite
+  >>> setSite(zoo)
+
+An object that is added and then modified several times is indexed
+once, when the transaction is committed:
+
+  >>> zoo['ellie'] = ellie = Mammoth(u'Ellie')
+  >>> for name in [u'Ellie the Mammoth', u'Ellie the Great']:
+  ...     ellie.name = name
+  ...     grok.notify(grok.ObjectModifiedEvent(ellie))
+  >>> find(zoo, u'Ellie the Great')
+  []
+  >>> indexed
+  []
+  >>> transaction.commit()
+  >>> find(zoo, u'Ellie the Great')
+  ['ellie']
+  >>> indexed
+  ['Ellie the Great']
+
+Searches in the same transaction see the queued updates once they are
+flushed:
+
+  >>> del indexed[:]
+  >>> ellie.name = u'Ellie'
+  >>> grok.notify(grok.ObjectModifiedEvent(ellie))
+  >>> find(zoo, u'Ellie')
+  []
+  >>> indexing.flush()
+  >>> find(zoo, u'Ellie')
+  ['ellie']
+  >>> transaction.commit()
+  >>> indexed
+  ['Ellie']
+
+Objects that are added and removed again are never indexed:
+
+  >>> del indexed[:]
+  >>> zoo['manfred'] = Mammoth(u'Manfred')
+  >>> del zoo['manfred']
+  >>> transaction.commit()
+  >>> indexed
+  []
+
+Rolling back a savepoint also drops the updates queued since:
+
+  >>> savepoint = transaction.savepoint()
+  >>> zoo['manfred'] = Mammoth(u'Manfred')
+  >>> savepoint.rollback()
+  >>> del ellie.__parent__['ellie']
+  >>> transaction.commit()
+  >>> indexed
+  []
+  >>> find(zoo, u'Ellie')
+  []
+
+  >>> indexing.disable_queue()
+  >>> setSite(None)
+
+"""
+import grok
+from zope import component, interface, schema
+from zope.catalog.catalog import Catalog
+from zope.catalog.field import FieldIndex
+from zope.catalog.interfaces import ICatalog
+from zope.intid import IntIds
+from zope.intid.interfaces import IIntIds
+
+indexed = []
+
+
+class CountingFieldIndex(FieldIndex):
+
+    def index_doc(self, docid, value):
+        indexed.append(value.name)
+        super(CountingFieldIndex, self).index_doc(docid, value)
+
+
+def setup_catalog(catalog):
+    catalog['name'] = CountingFieldIndex('name', IMammoth)
+
+
+def find(site, name):
+    catalog = component.getUtility(ICatalog, context=site)
+    return sorted(mammoth.__name__ for mammoth in
+                  catalog.searchResults(name=(name, name)))
+
+
+class Zoo(grok.Site, grok.Container):
+    grok.local_utility(IntIds, provides=IIntIds)
+    grok.local_utility(Catalog, provides=ICatalog, setup=setup_catalog)
+
+
+class IMammoth(interface.Interface):
+    name = schema.TextLine(title=u"Name")
+
+
+@grok.implementer(IMammoth)
+class Mammoth(grok.Model):
+
+    def __init__(self, name):
+        self.name = name
@@ -0,0 +1,103 @@
+"""
+Views using the ``grok.conditional()`` directive carry validators
+derived from the last change of their context::
+
+  >>> import transaction
+  >>> getRootFolder()['manfred'] = manfred = Mammoth()
+  >>> transaction.commit()
+
+  >>> app = wsgi_app()
+  >>> response = http(app, b'GET /manfred HTTP/1.1')
+  >>> print(response.getBody().decode('utf-8'))
+  Manfred is 3 meters tall.
+  >>> etag = response.getHeader('ETag')
+  >>> etag
+  'W/"..."'
+  >>> modified = response.getHeader('Last-Modified')
+  >>> modified
+  '... GMT'
+  >>> rendered
+  ['update', 'render']
+
+Asking again with the ETag results in a 304 response, without updating
+or rendering the view::
+
+  >>> del rendered[:]
+  >>> response = http(app, b'GET /manfred HTTP/1.1\\nIf-None-Match: '
+  ...                 + etag.encode('ascii'))
+  >>> response.getStatus()
+  304
+  >>> response.getBody()
+  b''
+  >>> rendered
+  []
+
+The same goes for the Last-Modified time::
+
+  >>> response = http(app, b'GET /manfred HTTP/1.1\\nIf-Modified-Since: '
+  ...                 + modified.encode('ascii'))
+  >>> response.getStatus()
+  304
+  >>> rendered
+  []
+
+Other principals get other ETags::
+
+  >>> response = http(app, b'GET /manfred HTTP/1.1\\n'
+  ...                 b'Authorization: Basic mgr:mgrpw\\n'
+  ...                 b'If-None-Match: ' + etag.encode('ascii'))
+  >>> response.getStatus()
+  200
+  >>> response.getHeader('ETag') == etag
+  False
+
+Once the context changes, the view is rendered again::
+
+  >>> del rendered[:]
+  >>> manfred.height = 4
+  >>> transaction.commit()
+  >>> response = http(app, b'GET /manfred HTTP/1.1\\nIf-None-Match: '
+  ...                 + etag.encode('ascii'))
+  >>> response.getStatus()
+  200
+  >>> print(response.getBody().decode('utf-8'))
+  Manfred is 4 meters tall.
+  >>> response.getHeader('ETag') == etag
+  False
+  >>> rendered
+  ['update', 'render']
+
+Views without the directive are not affected::
+
+  >>> response = http(app, b'GET /manfred/plain HTTP/1.1\\nIf-None-Match: '
+  ...                 + etag.encode('ascii'))
+  >>> response.getStatus()
+  200
+  >>> response.getHeader('ETag') is None
+  True
+
+"""
+import grok
+
+rendered = []
+
+
+class Mammoth(grok.Model):
+    height = 3
+
+
+class Index(grok.View):
+    grok.conditional()
+
+    def update(self):
+        rendered.append('update')
+
+    def render(self):
+        rendered.append('render')
+        return 'Manfred is %s meters tall.' % self.context.height
+
+
+class Plain(grok.View):
+
+    def render(self):
+        return 'Manfred is %s meters tall.' % self.context.height
@@ -0,0 +1,133 @@
+"""
+A ``grok.ContainerListing`` shows the items of a container in batches.
+Only the keys of a batch are read from the container, and only its
+items are loaded::
+
+  >>> import transaction
+  >>> root = getRootFolder()
+  >>> root['herd'] = herd = Herd()
+  >>> for name in ['ellie', 'manfred', 'diego', 'sid', 'scrat']:
+  ...     herd[name] = Mammoth(name.capitalize())
+  >>> transaction.commit()
+
+  >>> from zope.testbrowser.wsgi import Browser
+  >>> browser = Browser()
+  >>> browser.handleErrors = False
+  >>> browser.open('http://localhost/herd')
+  >>> print(browser.contents)
+  Diego, Ellie
+  next: http://localhost/herd/index?cursor=...
+
+The cursor in the URL of the following batch is where the batch
+starts, so getting a batch costs the same wherever it starts::
+
+  >>> browser.open(browser.contents.split('next: ')[1])
+  >>> print(browser.contents)
+  Manfred, Scrat
+  next: http://localhost/herd/index?cursor=...
+  >>> browser.open(browser.contents.split('next: ')[1])
+  >>> print(browser.contents)
+  Sid
+  >>> last = browser.url
+
+A garbled cursor shows the first batch:
+
+  >>> browser.open('http://localhost/herd/index?cursor=nonsense')
+  >>> print(browser.contents)
+  Diego, Ellie
+  next: http://localhost/herd/index?cursor=...
+
+Listings using ``grok.cache()`` are cached per batch, for as long as the
+same items with the same changes are in it:
+
+  >>> rendered
+  ['Diego, Ellie', 'Manfred, Scrat', 'Sid']
+  >>> browser.open(last)
+  >>> rendered
+  ['Diego, Ellie', 'Manfred, Scrat', 'Sid']
+  >>> del rendered[:]
+  >>> herd['sid'].name = 'Sid the Sloth'
+  >>> transaction.commit()
+  >>> browser.open(last)
+  >>> print(browser.contents)
+  Sid the Sloth
+  >>> herd['zeke'] = Mammoth('Zeke')
+  >>> transaction.commit()
+  >>> browser.open(last)
+  >>> print(browser.contents)
+  Sid the Sloth, Zeke
+  >>> rendered
+  ['Sid the Sloth', 'Sid the Sloth, Zeke']
+
+Batches of a ``grok.BTreeOrderedContainer`` follow the order of its
+items:
+
+  >>> root['line'] = line = Line()
+  >>> for name in ['ellie', 'manfred', 'diego']:
+  ...     line[name] = Mammoth(name.capitalize())
+  >>> line.move('diego', before='ellie')
+  >>> transaction.commit()
+  >>> browser.open('http://localhost/line')
+  >>> print(browser.contents)
+  Diego, Ellie
+  next: http://localhost/line/index?cursor=...
+  >>> browser.open(browser.contents.split('next: ')[1])
+  >>> print(browser.contents)
+  Manfred
+
+The batches themselves can be used outside of views too:
+
+  >>> from grok.container import Batch
+  >>> batch = Batch(herd, size=4)
+  >>> batch.keys()
+  ['diego', 'ellie', 'manfred', 'scrat']
+  >>> Batch(herd, batch.next, size=4).keys()
+  ['sid', 'zeke']
+  >>> Batch(line, batch.next)
+  Traceback (most recent call last):
+  ...
+  ValueError: Invalid cursor '...'.
+
+"""
+import grok
+
+rendered = []
+
+
+class Herd(grok.Container):
+    pass
+
+
+class Line(grok.BTreeOrderedContainer):
+    pass
+
+
+class Mammoth(grok.Model):
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Index(grok.ContainerListing):
+    grok.context(Herd)
+    grok.cache()
+    batch_size = 2
+
+    def render(self):
+        names = ', '.join(mammoth.name for mammoth in self.batch)
+        rendered.append(names)
+        if self.next_url() is None:
+            return names
+        return '%s\nnext: %s' % (names, self.next_url())
+
+
+class LineIndex(grok.ContainerListing):
+    grok.context(Line)
+    grok.name('index')
+    batch_size = 2
+
+    def render(self):
+        names = ', '.join(mammoth.name for mammoth in self.batch)
+        if self.next_url() is None:
+            return names
+        return '%s\nnext: %s' % (names, self.next_url())
@@ -0,0 +1,79 @@
+"""
+Views can send short messages to the user with ``flash()``. The
+messages are kept in the session until they are received::
+
+  >>> getRootFolder()['manfred'] = Mammoth()
+
+  >>> from zope.testbrowser.wsgi import Browser
+  >>> browser = Browser()
+  >>> browser.handleErrors = False
+  >>> browser.open('http://localhost/manfred/feed')
+  >>> browser.url
+  'http://localhost/manfred/index'
+  >>> print(browser.contents)
+  Manfred ate.
+
+Sending a message also sets a marker cookie, which is expired as soon
+as the messages have been received::
+
+  >>> print(browser.headers['Set-Cookie'])
+  grok.flash=deleted; ...
+  >>> 'grok.flash' in browser.cookies
+  False
+
+Without the marker cookie the messages are not looked up in the
+session::
+
+  >>> browser.open('http://localhost/manfred/index')
+  >>> print(browser.contents)
+  <BLANKLINE>
+  >>> 'Set-Cookie' in browser.headers
+  False
+
+Looking up the session would give a new user a session cookie. A user
+who never got a message does not get one::
+
+  >>> browser = Browser()
+  >>> browser.open('http://localhost/manfred/index')
+  >>> print(browser.contents)
+  <BLANKLINE>
+  >>> list(browser.cookies.keys())
+  []
+
+Messages sent and received within one request are shown right away::
+
+  >>> browser.open('http://localhost/manfred/feedhere')
+  >>> print(browser.contents)
+  Manfred ate here.
+  >>> 'grok.flash' in browser.cookies
+  False
+
+"""
+import grok
+import grokcore.message
+
+
+class Mammoth(grok.Model):
+    pass
+
+
+class Index(grok.View):
+
+    def render(self):
+        return u'\n'.join(
+            message.message for message in grokcore.message.receive())
+
+
+class Feed(grok.View):
+
+    def render(self):
+        self.flash(u'Manfred ate.')
+        self.redirect(self.url('index'))
+
+
+class FeedHere(grok.View):
+
+    def render(self):
+        self.flash(u'Manfred ate here.')
+        return u'\n'.join(
+            message.message for message in grokcore.message.receive())
@@ -0,0 +1,76 @@
+"""
+Form pages only look up their layout when they render. A form that
+redirects after processing its input never does::
+
+  >>> getRootFolder()['manfred'] = Mammoth()
+
+  >>> from zope.testbrowser.wsgi import Browser
+  >>> browser = Browser()
+  >>> browser.handleErrors = False
+  >>> browser.open('http://localhost/manfred/edit')
+  >>> len(layouts)
+  1
+  >>> browser.getControl('Name').value = 'Manfred the Mammoth'
+  >>> browser.getControl('Save').click()
+  >>> browser.url
+  'http://localhost/manfred/index'
+  >>> print(browser.contents)
+  Manfred the Mammoth
+  >>> len(layouts)
+  1
+
+The layout is still available to the ``update()`` method of the form::
+
+  >>> browser.open('http://localhost/manfred/layoutaware')
+  >>> print(browser.contents)
+  <div>Master</div>
+  >>> len(layouts)
+  2
+
+"""
+import grok
+from zope import interface, schema
+
+layouts = []
+
+
+class IMammoth(interface.Interface):
+    name = schema.TextLine(title=u"Name")
+
+
+@grok.implementer(IMammoth)
+class Mammoth(grok.Model):
+    name = u'Manfred'
+
+
+class Index(grok.View):
+
+    def render(self):
+        return self.context.name
+
+
+class Master(grok.Layout):
+
+    def __init__(self, request, context):
+        layouts.append(context)
+        super(Master, self).__init__(request, context)
+
+    def render(self):
+        return '<div>%s</div>' % self.view.content()
+
+
+class Edit(grok.EditFormPage):
+
+    @grok.action('Save')
+    def save(self, **data):
+        self.applyData(self.context, **data)
+        self.redirect(self.url(self.context, 'index'))
+
+
+class LayoutAware(grok.FormPage):
+
+    def update(self):
+        self.layout_name = self.layout.__class__.__name__
+
+    def content(self):
+        return self.layout_name
@@ -0,0 +1,168 @@
+"""
+Views can return an iterator from their ``render()`` method. Its chunks
+are sent to the user as they are produced::
+
+  >>> getRootFolder()['herd'] = herd = Herd()
+  >>> for name in ['manfred', 'ellie', 'diego']:
+  ...     herd[name] = Mammoth()
+
+  >>> from zope.testbrowser.wsgi import Browser
+  >>> browser = Browser()
+  >>> browser.handleErrors = False
+  >>> browser.open('http://localhost/herd/listing')
+  >>> print(browser.contents)
+  <ul>
+  <li>diego</li>
+  <li>ellie</li>
+  <li>manfred</li>
+  </ul>
+  >>> browser.headers['Content-Type']
+  'text/html;charset=utf-8'
+
+The chunks are only produced after the view has been published and the
+response headers have been sent. The database connection, the site and the security
+interaction of the request are still available then::
+
+  >>> del log[:]
+  >>> from webob import Request
+  >>> def start_response(status, headers):
+  ...     log.append('start response')
+  ...     print(status)
+  ...     print(sorted(name for name, value in headers))
+  >>> app = wsgi_app()
+  >>> result = app(Request.blank('/herd/listing').environ, start_response)
+  >>> chunks = list(result)
+  200 Ok
+  ['Content-Type']
+  >>> log
+  ['update', 'start response', 'chunk', 'chunk', 'chunk']
+  >>> print(b''.join(chunks).decode('utf-8'))
+  <ul>
+  <li>diego</li>
+  <li>ellie</li>
+  <li>manfred</li>
+  </ul>
+  >>> result.close()
+
+Other content types and character sets are honoured::
+
+  >>> browser.open('http://localhost/herd/export')
+  >>> browser.headers['Content-Type']
+  'text/csv;charset=latin-1'
+  >>> print(browser.contents)
+  name,size
+  diego,big
+  ellie,big
+  manfred,big
+
+Views that redirect in their ``update()`` method don't stream anything::
+
+  >>> browser.open('http://localhost/herd/moved')
+  >>> browser.url
+  'http://localhost/herd/listing'
+
+Pages stream their content within their layout. The layout is sent
+first::
+
+  >>> browser.open('http://localhost/herd/page')
+  >>> print(browser.contents)
+  <html>
+  <body>
+  <h1>The herd</h1>
+  <div id="content"><ul>
+  <li>diego</li>
+  <li>ellie</li>
+  <li>manfred</li>
+  </ul></div>
+  </body>
+  </html>
+
+Form pages that redirect after the form has been processed don't render
+their layout::
+
+  >>> browser.open('http://localhost/herd/form?redirect=yes')
+  >>> browser.url
+  'http://localhost/herd/listing'
+
+"""
+import grok
+
+log = []
+
+
+class Herd(grok.Application, grok.Container):
+    pass
+
+
+class Mammoth(grok.Model):
+    pass
+
+
+class Listing(grok.View):
+    grok.context(Herd)
+
+    def update(self):
+        log.append('update')
+
+    def render(self):
+        yield '<ul>\n'
+        for name in self.context:
+            log.append('chunk')
+            yield '<li>%s</li>\n' % name
+        yield '</ul>'
+
+
+class Export(grok.View):
+    grok.context(Herd)
+
+    def update(self):
+        self.response.setHeader('Content-Type', 'text/csv;charset=latin-1')
+
+    def render(self):
+        yield 'name,size\n'
+        for name in self.context:
+            yield '%s,big\n' % name
+
+
+class Moved(grok.View):
+    grok.context(Herd)
+
+    def update(self):
+        self.redirect(self.url('listing'))
+
+    def render(self):
+        raise AssertionError('Not rendered after a redirect.')
+        yield
+
+
+class Master(grok.Layout):
+    grok.context(Herd)
+
+
+master = grok.PageTemplate("""\
+<html>
+<body>
+<h1>The herd</h1>
+<div id="content" tal:content="structure view/content"></div>
+</body>
+</html>
+""")
+
+
+class Page(grok.Page):
+    grok.context(Herd)
+
+    def render(self):
+        yield '<ul>\n'
+        for name in self.context:
+            yield '<li>%s</li>\n' % name
+        yield '</ul>'
+
+
+class Form(grok.FormPage):
+    grok.context(Herd)
+    form_fields = grok.AutoFields(Herd)
+
+    def update(self, redirect=None):
+        if redirect:
+            self.redirect(self.url('listing'))
@@ -70,14 +70,19 @@ def suiteFromPackage(name):
 def test_suite():
     suite = unittest.TestSuite()
     for name in [
+        'cache',
         'catalog',
         'chameleon',
+        'conditional',
+        'container',
         'errorviews',
+        'flash',
         'form',
         'forms',
         'lifecycle',
         'security',
         'site',
+        'streaming',
         'traversal',
         'url',
         'viewlet',
@@ -0,0 +1,87 @@
+"""
+In frozen mode, the view factories looked up for the ``@@`` namespace
+and for default views of Grok contexts are kept in a table::
+
+  >>> import grok.viewlookup
+  >>> grok.viewlookup.freeze()
+
+  >>> getRootFolder()["cave"] = Cave()
+  >>> from zope.testbrowser.wsgi import Browser
+  >>> browser = Browser()
+  >>> browser.handleErrors = False
+  >>> browser.open("http://localhost/cave")
+  >>> print(browser.contents)
+  A cave.
+  >>> browser.open("http://localhost/cave/@@painting")
+  >>> print(browser.contents)
+  A painting of a mammoth.
+
+Requests with a skin applied get their own entries::
+
+  >>> browser.open("http://localhost/++skin++frozen/cave/@@painting")
+  >>> print(browser.contents)
+  A skinned painting of a mammoth.
+
+Views that do not exist are still not found::
+
+  >>> browser.open("http://localhost/cave/@@drawing")
+  Traceback (most recent call last):
+    ...
+  zope.publisher.interfaces.NotFound: Object: <grok.ftests.traversal.frozenviews.Cave object at ...>, name: '@@drawing'
+
+Registering a new view throws the table away, so the new view is found
+right away::
+
+  >>> from zope.publisher.browser import TestRequest
+  >>> from grok.viewlookup import queryView
+  >>> cave = getRootFolder()["cave"]
+  >>> print(queryView(cave, TestRequest(), 'drawing'))
+  None
+
+  >>> from zope.component import provideAdapter
+  >>> from zope.interface import Interface
+  >>> provideAdapter(
+  ...     Drawing, (Cave, IDefaultBrowserLayer), Interface, name='drawing')
+  >>> queryView(cave, TestRequest(), 'drawing')()
+  'A drawing of a mammoth.'
+
+  >>> grok.viewlookup.thaw()
+
+"""
+import grok
+from zope.publisher.browser import BrowserView
+from zope.publisher.interfaces.browser import IDefaultBrowserLayer
+
+
+class Cave(grok.Model):
+    pass
+
+
+class Index(grok.View):
+
+    def render(self):
+        return "A cave."
+
+
+class Painting(grok.View):
+
+    def render(self):
+        return "A painting of a mammoth."
+
+
+class FrozenLayer(IDefaultBrowserLayer):
+    grok.skin('frozen')
+
+
+class SkinnedPainting(grok.View):
+    grok.layer(FrozenLayer)
+    grok.name('painting')
+
+    def render(self):
+        return "A skinned painting of a mammoth."
+
+
+class Drawing(BrowserView):
+
+    def __call__(self):
+        return "A drawing of a mammoth."
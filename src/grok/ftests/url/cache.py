@@ -0,0 +1,101 @@
+"""
+URLs computed by views are remembered for the duration of a request, so
+that templates can ask for the same URLs many times cheaply::
+
+  >>> getRootFolder()['cave'] = cave = Cave()
+  >>> cave['caveman'] = CaveMan()
+
+  >>> from zope.testbrowser.wsgi import Browser
+  >>> browser = Browser()
+  >>> browser.handleErrors = False
+  >>> browser.open('http://localhost/cave/caveman')
+  >>> print(browser.contents)
+  http://localhost/cave/caveman/index
+  http://localhost/cave/caveman
+  http://localhost/cave/caveman/edit
+  http://localhost/cave
+  http://localhost/cave/second
+  http://localhost/cave/caveman/index?key=value
+  cached: 6
+
+Each request starts afresh::
+
+  >>> del cave['caveman']
+  >>> cave['cavewoman'] = CaveMan()
+  >>> browser.open('http://localhost/cave/cavewoman')
+  >>> print(browser.contents)
+  http://localhost/cave/cavewoman/index
+  http://localhost/cave/cavewoman
+  http://localhost/cave/cavewoman/edit
+  http://localhost/cave
+  http://localhost/cave/second
+  http://localhost/cave/cavewoman/index?key=value
+  cached: 6
+
+Moving objects around during a request throws the URLs remembered so far
+away::
+
+  >>> browser.open('http://localhost/cave/cavewoman/rename')
+  >>> print(browser.contents)
+  http://localhost/cave/cavewoman
+  http://localhost/cave/caveperson
+
+Data that cannot be part of the key is passed on without caching::
+
+  >>> browser.open('http://localhost/cave/caveperson/lists')
+  >>> print(browser.contents)
+  http://localhost/cave/caveperson?key=a&key=b
+  cached: 0
+
+"""
+import grok
+from grok.util import URL_CACHE_KEY
+
+
+class Cave(grok.Application, grok.Container):
+    pass
+
+
+class CaveMan(grok.Model):
+    pass
+
+
+class Index(grok.View):
+    grok.context(CaveMan)
+
+    def render(self):
+        urls = [
+            self.url(),
+            self.url(self.context),
+            self.url('edit'),
+            self.application_url(),
+            self.application_url('second'),
+            self.url(data={'key': 'value'}),
+            ]
+        # Asking again is served from the cache.
+        assert urls[3] == self.application_url()
+        assert urls[5] == self.url(data={'key': 'value'})
+        cache = self.request.annotations[URL_CACHE_KEY]
+        urls.append('cached: %d' % len(
+            [key for key in cache if key[0] != 'application']))
+        return '\n'.join(urls)
+
+
+class Rename(grok.View):
+    grok.context(CaveMan)
+
+    def render(self):
+        before = self.url(self.context)
+        cave = self.context.__parent__
+        del cave[self.context.__name__]
+        cave['caveperson'] = self.context
+        return '\n'.join([before, self.url(self.context)])
+
+
+class Lists(grok.View):
+    grok.context(CaveMan)
+
+    def render(self):
+        url = self.url(self.context, data={'key': ['a', 'b']})
+        cache = self.request.annotations.get(URL_CACHE_KEY, {})
+        return '\n'.join([url, 'cached: %d' % len(cache)])
@@ -0,0 +1,200 @@
+##############################################################################
+#
+# Copyright (c) 2006-2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Queued catalog indexing.
+
+zope.catalog updates all catalogs as soon as an object gets an id, is
+modified or loses its id.  An object that is modified several times in
+a transaction is indexed as many times.  In queued mode, the catalog
+updates are collected per transaction instead.  Only the last update of
+a document is kept, documents that are added and removed again are
+never indexed, and the catalogs are updated once just before the
+transaction is committed.  Savepoints roll back the queue along with
+the objects.
+
+Catalog searches made in the same transaction do not see the queued
+updates until :func:`flush` is called.
+
+Queued mode is enabled by setting the ``GROK_INDEX_QUEUE`` environment
+variable to ``on`` or by calling :func:`enable_queue`.
+"""
+import os
+
+import transaction
+from transaction.interfaces import IDataManager, ISavepointDataManager
+from zope import component
+from zope.catalog import catalog
+from zope.catalog.interfaces import (
+    ICatalog, INoAutoIndex, INoAutoReindex)
+from zope.interface import implementer
+from zope.intid.interfaces import (
+    IIntIdAddedEvent, IIntIdRemovedEvent, IIntIds)
+from zope.lifecycleevent.interfaces import IObjectModifiedEvent
+
+INDEX_QUEUE_ENVIRON = 'GROK_INDEX_QUEUE'
+
+_queued = os.environ.get(
+    INDEX_QUEUE_ENVIRON, 'no').lower() in ('yes', 'on', 'true')
+
+
+def enable_queue():
+    """Collect the catalog updates until the transaction is committed."""
+    global _queued
+    _queued = True
+
+
+def disable_queue():
+    """Update the catalogs right away again."""
+    global _queued
+    _queued = False
+
+
+def is_queued():
+    return _queued
+
+
+INDEX = 'index'
+UNINDEX = 'unindex'
+
+
+@implementer(IDataManager, ISavepointDataManager)
+class IndexQueue:
+    """The catalog updates of a transaction.
+
+    The queue takes part in the transaction only to follow savepoints
+    and aborts.  The updates themselves are applied by a before-commit
+    hook, as they change persistent objects.
+    """
+
+    def __init__(self, transaction_manager):
+        self.transaction_manager = transaction_manager
+        # (catalog, docid) -> [operation, object, added]
+        self.operations = {}
+        self.hooked = False
+
+    def add(self, operation, cat, docid, ob):
+        if not self.hooked:
+            # Updates queued by other before-commit hooks are applied
+            # by another run of this one.
+            self.transaction_manager.get().addBeforeCommitHook(
+                self.before_commit)
+            self.hooked = True
+        key = (cat, docid)
+        entry = self.operations.get(key)
+        if entry is None:
+            self.operations[key] = [operation, ob, operation == INDEX]
+        elif operation == UNINDEX and entry[2]:
+            # Never made it into the catalog.
+            del self.operations[key]
+        else:
+            entry[0] = operation
+            entry[1] = ob
+
+    def before_commit(self):
+        self.hooked = False
+        self.flush()
+
+    def flush(self):
+        operations, self.operations = self.operations, {}
+        for (cat, docid), (operation, ob, added) in operations.items():
+            if operation == INDEX:
+                cat.index_doc(docid, ob)
+            else:
+                cat.unindex_doc(docid)
+
+    def savepoint(self):
+        return QueueSavepoint(self)
+
+    def abort(self, txn):
+        self.operations = {}
+
+    def tpc_begin(self, txn):
+        pass
+
+    def commit(self, txn):
+        pass
+
+    def tpc_vote(self, txn):
+        pass
+
+    def tpc_finish(self, txn):
+        self.operations = {}
+
+    def tpc_abort(self, txn):
+        self.operations = {}
+
+    def sortKey(self):
+        return 'grok.indexing'
+
+
+class QueueSavepoint:
+
+    def __init__(self, queue):
+        self.queue = queue
+        self.operations = {
+            key: list(entry) for key, entry in queue.operations.items()}
+
+    def rollback(self):
+        self.queue.operations = {
+            key: list(entry) for key, entry in self.operations.items()}
+
+
+def _queue(create=True):
+    txn = transaction.get()
+    try:
+        return txn.data(IndexQueue)
+    except KeyError:
+        if not create:
+            return None
+    queue = IndexQueue(transaction.manager)
+    txn.set_data(IndexQueue, queue)
+    txn.join(queue)
+    return queue
+
+
+def flush():
+    """Apply the catalog updates queued in the current transaction."""
+    queue = _queue(create=False)
+    if queue is not None:
+        queue.flush()
+
+
+def _enqueue(operation, ob, query_id=False):
+    for cat in component.getAllUtilitiesRegisteredFor(ICatalog, context=ob):
+        intids = component.getUtility(IIntIds, context=cat)
+        docid = intids.queryId(ob) if query_id else intids.getId(ob)
+        if docid is not None:
+            _queue().add(operation, cat, docid, ob)
+
+
+@component.adapter(IIntIdAddedEvent)
+def indexDocSubscriber(event):
+    if not _queued:
+        return catalog.indexDocSubscriber(event)
+    if not INoAutoIndex.providedBy(event.object):
+        _enqueue(INDEX, event.object)
+
+
+@component.adapter(IObjectModifiedEvent)
+def reindexDocSubscriber(event):
+    if not _queued:
+        return catalog.reindexDocSubscriber(event)
+    if not INoAutoReindex.providedBy(event.object):
+        _enqueue(INDEX, event.object, query_id=True)
+
+
+@component.adapter(IIntIdRemovedEvent)
+def unindexDocSubscriber(event):
+    if not _queued:
+        return catalog.unindexDocSubscriber(event)
+    _enqueue(UNINDEX, event.object, query_id=True)
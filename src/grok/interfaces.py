@@ -51,9 +51,15 @@ class IGrokBaseClasses(
         grokcore.view.interfaces.IBaseClasses,
         grokcore.xmlrpc.interfaces.IBaseClasses):
 
+    BTreeOrderedContainer = interface.Attribute(
+        "Base class for large ordered containers.")
+
     Container = interface.Attribute(
         "Base class for containers.")
 
+    ContainerListing = interface.Attribute(
+        "Base class for views listing the items of a container in batches.")
+
     ExceptionView = interface.Attribute(
         "Base class for excetion views.")
 
@@ -78,7 +84,22 @@ class IGrokDirectives(
         grokcore.security.interfaces.IDirectives,
         grokcore.site.interfaces.IDirectives,
         grokcore.view.interfaces.IDirectives):
-    pass
+
+    def conditional(value=True):
+        """Answer conditional GET requests for a view.
+
+        Responses of the view carry an ETag and a Last-Modified header
+        computed from the last committed change of the view's context,
+        and requests for an unchanged context get a 304 response.
+        """
+
+    def cache(maxage=None, vary=()):
+        """Cache the output of a view, page or viewlet.
+
+        The output is kept for at most ``maxage`` seconds and until the
+        context is modified or removed.  ``vary`` names the request
+        variables the output depends on.
+        """
 
 
 class IGrokEvents(interface.Interface):
@@ -169,6 +190,16 @@ class IGrokAPI(
         name.
         """
 
+    def bulk_add(container, items):
+        """Add the ``(name, object)`` pairs of ``items`` to ``container``
+        in one go, sending a single container modified event.
+        """
+
+    def deferred_add(container):
+        """Return a context manager collecting items in a dictionary,
+        that are added to ``container`` with ``bulk_add()`` at the end.
+        """
+
 
 class IGrokView(grokcore.view.interfaces.IGrokView):
     """Grok views all provide this interface."""
@@ -0,0 +1,317 @@
+##############################################################################
+#
+# Copyright (c) 2006-2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Serve a Grok application from several pre-forked worker processes.
+
+The master process loads the configuration of the application, grokking
+all its packages, once.  Then it forks the workers, that share the
+loaded configuration copy-on-write and accept requests on the same
+listening socket, each with a pool of threads.  The workers open the
+databases after they are forked.  Several workers need storages that
+several processes can open at the same time, such as a ZEO client
+storage; with a FileStorage only a single worker can be used.
+
+The settings are read from the ``[prefork]`` section of a deployment
+ini file::
+
+  [prefork]
+  zope_conf = %(here)s/zope.conf
+  host = 127.0.0.1
+  port = 8080
+  workers = 4
+  threads = 4
+
+The logging is configured from the same file.  Start the master with::
+
+  $ bin/grok-prefork parts/etc/deploy.ini
+
+Workers that die are replaced.  ``SIGHUP`` reloads the application: the
+master executes itself again keeping the listening socket, loads the
+configuration, forks new workers and only then stops the old ones, that
+finish the requests they are handling first.  ``SIGTERM`` and ``SIGINT``
+stop the workers the same way before the master exits.  Serving needs
+the waitress package, installed with the ``deploy`` extra of grok.
+"""
+import argparse
+import configparser
+import logging
+import logging.config
+import os
+import select
+import signal
+import socket
+import sys
+import time
+
+import ZConfig
+import ZODB.config
+import zope.app.appsetup.product
+import zope.app.wsgi
+import zope.processlifetime
+from zope.app.appsetup import appsetup
+from zope.app.wsgi.interfaces import WSGIPublisherApplicationCreated
+from zope.event import notify
+
+logger = logging.getLogger('grok.prefork')
+
+# Set by the master for itself when it executes itself again on reload.
+SOCKET_ENVIRON = 'GROK_PREFORK_SOCKET'
+RETIRE_ENVIRON = 'GROK_PREFORK_RETIRE'
+
+# Storages that cannot be opened by several processes at once.
+LOCAL_STORAGES = (
+    ZODB.config.FileStorage,
+    ZODB.config.MappingStorage,
+    ZODB.config.DemoStorage,
+    )
+
+# Workers that die sooner than this after being forked are replaced only
+# after this delay, so a broken worker does not fork over and over.
+RESPAWN_DELAY = 1.0
+
+
+def load(zope_conf, schemafile=None, features=()):
+    """Load the Zope configuration `zope_conf`.
+
+    This does what :func:`zope.app.wsgi.config` does, except for opening
+    the databases.  Returns the configuration options.
+    """
+    if schemafile is None:
+        schemafile = os.path.join(
+            os.path.dirname(appsetup.__file__), 'schema', 'schema.xml')
+    schema = ZConfig.loadSchema(schemafile)
+    options, handlers = ZConfig.loadConfig(schema, zope_conf)
+    if options.path:
+        sys.path[:0] = [os.path.abspath(p) for p in options.path]
+    zope.app.appsetup.product.setProductConfigurations(
+        options.product_config)
+    options.eventlog()
+    for configure_logger in options.loggers:
+        configure_logger()
+    if options.devmode:
+        features += ('devmode',)
+        logger.warning(
+            "Developer mode is enabled: this is a security risk and "
+            "should NOT be enabled on production servers.")
+    appsetup.config(options.site_definition, features=features)
+    return options
+
+
+def open_databases(options):
+    """Open the databases of `options` and notify the subscribers.
+
+    Returns the main database.
+    """
+    db = appsetup.multi_database(options.databases)[0][0]
+    notify(zope.processlifetime.DatabaseOpened(db))
+    return db
+
+
+def shared(options):
+    """Tell whether several processes can open the databases at once."""
+    return not any(
+        isinstance(database.config.storage, LOCAL_STORAGES)
+        for database in options.databases)
+
+
+def serve(options, sock, threads):
+    """Serve the application from a worker until it is told to stop."""
+    import waitress.server
+    db = open_databases(options)
+    application = zope.app.wsgi.WSGIPublisherApplication(db)
+    notify(WSGIPublisherApplicationCreated(application))
+    server = waitress.server.create_server(
+        application, sockets=[sock], threads=threads)
+    try:
+        # A SystemExit ends the loop, and waitress waits for the threads
+        # to finish their requests.
+        server.run()
+    finally:
+        server.close()
+        db.close()
+
+
+def _stop(signum, frame):
+    raise SystemExit(0)
+
+
+class Master(object):
+    """The process forking and watching the workers.
+    """
+
+    def __init__(self, options, sock, workers=1, threads=4):
+        self.options = options
+        self.sock = sock
+        self.size = workers
+        self.threads = threads
+        self.workers = {}
+        self.stopping = False
+        self._signals = []
+        self._wakeup = ()
+
+    def spawn(self):
+        pid = os.fork()
+        if pid:
+            self.workers[pid] = time.time()
+            return pid
+        status = 0
+        try:
+            signal.set_wakeup_fd(-1)
+            os.close(self._wakeup[0])
+            os.close(self._wakeup[1])
+            signal.signal(signal.SIGTERM, _stop)
+            # The master tells the workers when to stop or reload.
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            serve(self.options, self.sock, self.threads)
+        except SystemExit:
+            pass
+        except BaseException:
+            logger.exception('Worker %d failed.', os.getpid())
+            status = 1
+        finally:
+            logging.shutdown()
+            # Never return into the code of the master.
+            os._exit(status)
+
+    def stop(self, pids, wait=False):
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        while wait and pids:
+            try:
+                pid, status = os.waitpid(-1, 0)
+            except ChildProcessError:
+                return
+            self.workers.pop(pid, None)
+            pids = [other for other in pids if other != pid]
+
+    def reap(self):
+        """Forget the workers that exited, replacing them if needed."""
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if not pid:
+                return
+            started = self.workers.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            logger.warning(
+                'Worker %d exited with status %d.', pid, status)
+            if time.time() - started < RESPAWN_DELAY:
+                time.sleep(RESPAWN_DELAY)
+            self.spawn()
+
+    def reload(self):
+        logger.info('Reloading.')
+        self.sock.set_inheritable(True)
+        os.environ[SOCKET_ENVIRON] = str(self.sock.fileno())
+        os.environ[RETIRE_ENVIRON] = ','.join(map(str, self.workers))
+        signal.set_wakeup_fd(-1)
+        argv = getattr(sys, 'orig_argv', [sys.executable] + sys.argv)
+        os.execv(sys.executable, argv)
+
+    def _signal(self, signum, frame):
+        self._signals.append(signum)
+
+    def run(self, retire=()):
+        """Fork the workers, then watch them until told to stop.
+
+        `retire` are the process ids of the workers of the master this
+        one replaces on reload.  They are stopped once the new workers
+        are forked.
+        """
+        self._wakeup = wakeup, wakeup_write = os.pipe()
+        os.set_blocking(wakeup_write, False)
+        signal.set_wakeup_fd(wakeup_write)
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP,
+                       signal.SIGCHLD):
+            signal.signal(signum, self._signal)
+
+        if retire and not shared(self.options):
+            # The old workers must close the storage before the new
+            # ones can open it.  New requests wait in the backlog.
+            self.stop(retire, wait=True)
+            retire = ()
+        for i in range(self.size):
+            self.spawn()
+        self.stop(retire)
+        logger.info('Serving on %s:%s with %d workers of %d threads.',
+                    self.sock.getsockname()[0], self.sock.getsockname()[1],
+                    self.size, self.threads)
+
+        while self.workers or not self.stopping:
+            select.select([wakeup], [], [], 1.0)
+            try:
+                os.read(wakeup, 1024)
+            except BlockingIOError:
+                pass
+            while self._signals:
+                signum = self._signals.pop(0)
+                if signum == signal.SIGHUP and not self.stopping:
+                    self.reload()
+                elif signum in (signal.SIGTERM, signal.SIGINT):
+                    if not self.stopping:
+                        logger.info('Stopping.')
+                        self.stopping = True
+                        self.stop(list(self.workers))
+            self.reap()
+
+
+def listen(host, port, backlog=1024):
+    """Return the listening socket, reusing the one inherited on reload."""
+    fileno = os.environ.pop(SOCKET_ENVIRON, None)
+    if fileno is not None:
+        return socket.socket(fileno=int(fileno))
+    return socket.create_server((host, port), backlog=backlog)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('config', help='deployment ini file')
+    arguments = parser.parse_args(argv)
+    path = os.path.abspath(arguments.config)
+    here = os.path.dirname(path)
+    config = configparser.ConfigParser(
+        defaults={'here': here, '__file__': path})
+    config.read(path)
+    if config.has_section('loggers'):
+        logging.config.fileConfig(
+            path, defaults={'here': here, '__file__': path},
+            disable_existing_loggers=False)
+    settings = config[
+        'prefork' if config.has_section('prefork') else config.default_section]
+
+    options = load(settings['zope_conf'])
+    workers = int(settings.get('workers') or os.cpu_count() or 1)
+    if workers > 1 and not shared(options):
+        parser.error(
+            'Several workers need a database storage that several '
+            'processes can open, such as ZEO.')
+    retire = [int(pid) for pid in
+              os.environ.pop(RETIRE_ENVIRON, '').split(',') if pid]
+    if not retire:
+        # Create the root folder and evolve the database once.
+        open_databases(options).close()
+    sock = listen(settings.get('host', '127.0.0.1'),
+                  int(settings.get('port', 8080)))
+    master = Master(options, sock, workers, int(settings.get('threads', 4)))
+    master.run(retire)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+##############################################################################
+#
+# Copyright (c) 2006-2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Cache for the rendered output of views, pages and viewlets.
+
+Components using the ``grok.cache()`` directive keep their output in an
+in-process cache, that is shared by all threads and bounded by the total
+length of the cached output.  Entries are keyed on the database, oid and
+serial of the context, the component class and name, the layers of the
+request, the principal and the request variables named by the
+directive.  As the serial changes with every committed change of the
+context, changes made by other processes are never served from the
+cache.  The entries of an object are dropped as soon as it is modified
+or removed in this process.
+
+The size of the cache in characters is read from the
+``GROK_RENDER_CACHE_SIZE`` environment variable.
+"""
+import collections
+import os
+import threading
+import time
+
+import ZODB.utils
+from zope import component
+from zope.interface import directlyProvidedBy
+from zope.interface.interfaces import IObjectEvent
+
+from grok.directive import cache
+
+CACHE_SIZE_ENVIRON = 'GROK_RENDER_CACHE_SIZE'
+
+
+class RenderCache(object):
+    """A least recently used cache with time limits.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._by_object = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value, size = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def set(self, key, value, size, maxage=None):
+        if size > self.maxsize:
+            return
+        expires = None
+        if maxage is not None:
+            expires = time.monotonic() + maxage
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires, value, size)
+            self._by_object.setdefault(key[:2], set()).add(key)
+            self.size += size
+            while self.size > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        expires, value, size = self._entries.pop(key)
+        self.size -= size
+        keys = self._by_object[key[:2]]
+        keys.discard(key)
+        if not keys:
+            del self._by_object[key[:2]]
+
+    def invalidate(self, obj):
+        """Drop all the entries for the object `obj`."""
+        jar = getattr(obj, '_p_jar', None)
+        oid = getattr(obj, '_p_oid', None)
+        if jar is None or oid is None:
+            return
+        with self._lock:
+            for key in list(self._by_object.get(
+                    (jar.db().database_name, oid), ())):
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_object.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+render_cache = RenderCache(
+    int(os.environ.get(CACHE_SIZE_ENVIRON, 16 * 1024 * 1024)))
+
+
+def _vary_value(value):
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def cache_key(component, settings, *extra):
+    """Return the key for the output of `component`.
+
+    Return ``None`` if the context is not a committed persistent object.
+    """
+    context = component.context
+    jar = getattr(context, '_p_jar', None)
+    if jar is None or context._p_oid is None:
+        return None
+    # A ghost does not know its serial yet.
+    context._p_activate()
+    serial = context._p_serial
+    if serial == ZODB.utils.z64:
+        return None
+    request = component.request
+    maxage, vary = settings
+    return (
+        jar.db().database_name,
+        context._p_oid,
+        serial,
+        component.__class__,
+        getattr(component, '__name__', None),
+        tuple(layer.__identifier__
+              for layer in directlyProvidedBy(request)),
+        getattr(request.principal, 'id', None),
+        tuple(_vary_value(request.get(name)) for name in vary),
+        ) + extra
+
+
+def lookup(component, *extra):
+    """Return the key and the cached output for `component`.
+
+    The cached output is ``None`` if there is none.  The key is ``None``
+    if the output of `component` is not to be cached.
+    """
+    settings = cache.bind().get(component)
+    if settings is None:
+        return None, None
+    try:
+        key = cache_key(component, settings, *extra)
+        output = key is not None and render_cache.get(key) or None
+    except TypeError:
+        # Request variables that cannot be part of a key.
+        return None, None
+    if output is None:
+        return key, None
+    output, headers = output
+    for name, value in headers:
+        component.request.response.setHeader(name, value)
+    return key, output
+
+
+def store(component, key, output):
+    """Remember the `output` of `component` under `key`."""
+    if key is None or not isinstance(output, str):
+        return output
+    response = component.request.response
+    if response.getStatus() in (302, 303):
+        return output
+    headers = []
+    content_type = response.getHeader('Content-Type')
+    if content_type is not None:
+        headers.append(('Content-Type', content_type))
+    maxage, vary = cache.bind().get(component)
+    render_cache.set(key, (output, headers), len(output), maxage)
+    return output
+
+
+@component.adapter(IObjectEvent)
+def invalidate(event):
+    """Drop the cached output for the object of `event`."""
+    render_cache.invalidate(event.object)
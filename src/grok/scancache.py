@@ -0,0 +1,277 @@
+##############################################################################
+#
+# Copyright (c) 2006-2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Persistent cache for the results of grokking modules.
+
+Grokking a module runs every applicable grokker over every component
+defined in it.  The outcome is a list of configuration actions plus a
+few attributes that grokkers set on the grokked classes (such as
+``module_info``).  As long as neither the module nor the modules it
+inherits from change, that outcome is the same on every start-up.
+
+When the ``GROK_SCAN_CACHE`` environment variable names a directory,
+the ``<grok:grok>`` ZCML directive (see :mod:`grok.zcml`) stores the
+outcome of grokking each module in that directory and replays it on
+the next start-up instead of running the grokkers again.  Modules that define grokkers themselves,
+or whose actions cannot be pickled, are always grokked normally.
+"""
+import hashlib
+import importlib
+import inspect
+import io
+import os
+import pickle
+import sys
+import types
+
+import martian.scan
+import martian.util
+from martian.components import GrokkerBase
+from martian.core import MetaGrokker
+from zope.interface import implementedBy
+from zope.interface.interface import Attribute
+
+from grokcore.component import zcml
+
+CACHE_DIR_ENVIRON = 'GROK_SCAN_CACHE'
+
+# Bump this whenever the layout of the cache entries changes.
+CACHE_FORMAT = 1
+
+# Classes are pickled by reference anyway, the rest are plain values.
+_BY_VALUE = (type, type(None), bool, int, float, str, bytes, tuple)
+
+
+class _ActionPickler(pickle.Pickler):
+    """Pickle actions and class attributes by reference where possible.
+
+    Module level objects, schema fields of interfaces and grokker
+    instances are stored as references, so that unpickling them hands
+    out the very same objects grokking would have used.
+    """
+
+    def __init__(self, file, module_info):
+        pickle.Pickler.__init__(self, file, pickle.HIGHEST_PROTOCOL)
+        self.module_info = module_info
+        self.module_globals = {}
+
+    def global_name(self, module_name, obj):
+        names = self.module_globals.get(module_name)
+        if names is None:
+            names = self.module_globals[module_name] = dict(
+                (id(value), name) for name, value in
+                vars(sys.modules.get(module_name, object)).items())
+        return names.get(id(obj))
+
+    def persistent_id(self, obj):
+        if obj is self.module_info:
+            return ('module_info',)
+        if isinstance(obj, _BY_VALUE):
+            return None
+        if isinstance(obj, martian.scan.ModuleInfo):
+            raise pickle.PicklingError(
+                "Cannot cache foreign module info %r." % obj)
+        if isinstance(obj, GrokkerBase):
+            return ('grokker', obj.__class__)
+        if isinstance(obj, types.FunctionType):
+            return None
+        module_name = self.module_info.dotted_name
+        name = self.global_name(module_name, obj)
+        if name is None:
+            # Singletons such as zope.securitypolicy's
+            # rolePermissionManager live in the module of their class.
+            module_name = obj.__class__.__module__
+            name = self.global_name(module_name, obj)
+        if name is not None:
+            return ('global', module_name, name)
+        if isinstance(obj, Attribute) and obj.interface is not None:
+            return ('attribute', obj.interface, obj.__name__)
+        return None
+
+
+class _ActionUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, module_info):
+        pickle.Unpickler.__init__(self, file)
+        self.module_info = module_info
+
+    def persistent_load(self, pid):
+        kind = pid[0]
+        if kind == 'module_info':
+            return self.module_info
+        if kind == 'grokker':
+            return pid[1]()
+        if kind == 'global':
+            return getattr(importlib.import_module(pid[1]), pid[2])
+        if kind == 'attribute':
+            return pid[1][pid[2]]
+        raise pickle.UnpicklingError("Unknown reference %r." % (pid,))
+
+
+def _local_classes(module):
+    for name, obj in sorted(vars(module).items()):
+        if isinstance(obj, type) and martian.util.defined_locally(
+                obj, module.__name__):
+            yield obj
+
+
+def _source_stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _dependencies(module):
+    """Return the source files the grokking of `module` depends on.
+
+    Besides the module itself, these are the modules of all the base
+    classes and implemented interfaces of the classes it defines, as
+    directive values are inherited from them.
+    """
+    modules = set([module.__name__])
+    for cls in _local_classes(module):
+        for base in inspect.getmro(cls):
+            modules.add(base.__module__)
+        for iface in implementedBy(cls).flattened():
+            modules.add(iface.__module__)
+    paths = {}
+    for name in sorted(modules):
+        path = getattr(sys.modules.get(name), '__file__', None)
+        if path is None:
+            continue
+        paths[path] = _source_stamp(path)
+    return paths
+
+
+class ScanCache(object):
+    """A directory holding one cache entry per grokked module."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, module_info):
+        return os.path.join(
+            self.directory, module_info.dotted_name + '.grokcache')
+
+    def fingerprint(self, module_info, grokkers):
+        """Compute the key for a module and the grokkers applicable to it.
+        """
+        key = hashlib.sha1()
+        key.update(('%s:%s\n' % (
+            CACHE_FORMAT, module_info.dotted_name)).encode('utf-8'))
+        for grokker, name, obj in grokkers:
+            key.update(('%s %s.%s\n' % (
+                name,
+                grokker.__class__.__module__,
+                grokker.__class__.__name__)).encode('utf-8'))
+        return key.hexdigest()
+
+    def load(self, module_info, fingerprint):
+        """Return the cached actions and class attributes for a module.
+
+        Return ``None`` when there is no valid cache entry.
+        """
+        try:
+            with open(self._path(module_info), 'rb') as f:
+                entry = pickle.load(f)
+        except Exception:
+            return None
+        if entry.get('fingerprint') != fingerprint:
+            return None
+        for path, stamp in entry['dependencies'].items():
+            if _source_stamp(path) != stamp:
+                return None
+        try:
+            return _ActionUnpickler(
+                io.BytesIO(entry['payload']), module_info).load()
+        except Exception:
+            # The entry refers to something that went away.
+            return None
+
+    def store(self, module_info, fingerprint, actions, attributes):
+        """Store the outcome of grokking a module.
+
+        Return ``False`` if the outcome cannot be cached.
+        """
+        payload = io.BytesIO()
+        try:
+            _ActionPickler(payload, module_info).dump(
+                dict(actions=actions, attributes=attributes))
+        except Exception:
+            return False
+        entry = dict(
+            fingerprint=fingerprint,
+            dependencies=_dependencies(module_info.getModule()),
+            payload=payload.getvalue())
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        path = self._path(module_info)
+        # Write to a temporary file first so that concurrently starting
+        # processes never see a partially written entry.
+        tmp = '%s.%s.tmp' % (path, os.getpid())
+        with open(tmp, 'wb') as f:
+            pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+        os.rename(tmp, path)
+        return True
+
+
+def _snapshot(module):
+    return [(cls, dict(vars(cls))) for cls in _local_classes(module)]
+
+
+def _changed_attributes(snapshot):
+    changed = []
+    for cls, before in snapshot:
+        for name, value in vars(cls).items():
+            if name not in before or before[name] is not value:
+                changed.append((cls.__name__, name, value))
+    return changed
+
+
+def grok_module(module_info, config, cache):
+    module = module_info.getModule()
+    grokker = zcml.the_module_grokker
+    grokkers = list(grokker.grokkers(module_info.dotted_name, module))
+    if any(isinstance(g, MetaGrokker) for g, name, obj in grokkers):
+        # This module registers grokkers, which changes what other
+        # modules grok into.  Never cache it.
+        grokker.grok(module_info.dotted_name, module,
+                     module_info=module_info, config=config)
+        return
+    fingerprint = cache.fingerprint(module_info, grokkers)
+    entry = cache.load(module_info, fingerprint)
+    if entry is not None:
+        cache.hits += 1
+        for cls_name, name, value in entry['attributes']:
+            setattr(getattr(module, cls_name), name, value)
+        for action in entry['actions']:
+            config.action(**action)
+        return
+    cache.misses += 1
+    snapshot = _snapshot(module)
+    start = len(config.actions)
+    grokker.grok(module_info.dotted_name, module,
+                 module_info=module_info, config=config)
+    actions = [
+        dict(discriminator=action['discriminator'],
+             callable=action['callable'],
+             args=action['args'],
+             kw=action['kw'],
+             order=action['order'])
+        for action in config.actions[start:]]
+    cache.store(
+        module_info, fingerprint, actions, _changed_attributes(snapshot))
@@ -0,0 +1,158 @@
+##############################################################################
+#
+# Copyright (c) 2006-2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Streaming view results.
+
+A view whose ``render()`` method returns an iterator, a generator for
+instance, has its output sent to the client chunk by chunk, as the
+iterator produces it.  When the view is rendered in a layout, the
+layout is rendered first and the chunks are streamed in place of the
+view's content.
+
+The chunks are produced after the publisher has committed the
+transaction of the request.  The database connection, the site and the
+security interaction of the request are kept around until the last
+chunk has been sent, so that the iterator can still read from the
+application.  Changes made while streaming are not committed.
+"""
+import uuid
+from collections.abc import Iterator
+
+import transaction
+import zope.component.hooks
+import zope.contenttype.parse
+import zope.security.management
+from zope.interface import implementer
+from zope.publisher.interfaces.http import IResult
+from zope.publisher.interfaces import IHeld
+from zope.security.interfaces import IParticipation
+
+# Stands in for the content of a streaming view while its layout is
+# rendered.
+MARKER = 'grok-stream-%s' % uuid.uuid4().hex
+
+
+def is_stream(result):
+    return isinstance(result, Iterator)
+
+
+def in_layout(rendered, chunks):
+    """Return the chunks of `rendered` with `chunks` in place of the marker.
+    """
+    head, marker, tail = rendered.partition(MARKER)
+    if not marker:
+        # The layout did not render the content of the view.
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+        yield rendered
+        return
+    yield head
+    yield from chunks
+    yield tail
+
+
+@implementer(IParticipation)
+class Participation(object):
+    """Stands in for the request, which left its interaction behind."""
+
+    interaction = None
+
+    def __init__(self, principal):
+        self.principal = principal
+
+
+@implementer(IResult)
+class StreamResult(object):
+    """Send the chunks of an iterator to the client as they are produced.
+    """
+
+    def __init__(self, request, chunks):
+        self.request = request
+        self.chunks = iter(chunks)
+        self.site = zope.component.hooks.getSite()
+        response = request.response
+        content_type = response.getHeader('Content-Type')
+        if content_type is None:
+            content_type = 'text/html;charset=utf-8'
+        major, minor, params = zope.contenttype.parse.parse(content_type)
+        if major == 'text' and 'charset' not in params:
+            content_type += ';charset=utf-8'
+        self.encoding = params.get('charset', 'utf-8')
+        response.setHeader('Content-Type', content_type)
+        # Take over what the request holds on to, most notably the
+        # database connection, from the request: the request is closed
+        # when publishing is done, long before the last chunk is sent.
+        held = request._held
+        self.held = tuple(h for h in held if IHeld.providedBy(h))
+        request._held = tuple(h for h in held if not IHeld.providedBy(h))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.chunks is None:
+            raise StopIteration
+        site = zope.component.hooks.getSite()
+        zope.component.hooks.setSite(self.site)
+        interaction = zope.security.management.queryInteraction()
+        if interaction is None:
+            zope.security.management.newInteraction(
+                Participation(self.request.principal))
+        try:
+            chunk = next(self.chunks)
+        except BaseException:
+            self.close()
+            raise
+        finally:
+            if interaction is None:
+                zope.security.management.endInteraction()
+            zope.component.hooks.setSite(site)
+        if isinstance(chunk, str):
+            chunk = chunk.encode(self.encoding)
+        return chunk
+
+    def close(self):
+        """Release the resources of the request.
+
+        WSGI servers call this once the response has been sent, even if
+        sending it failed halfway.
+        """
+        chunks, self.chunks = self.chunks, None
+        if chunks is None:
+            return
+        try:
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+        finally:
+            transaction.abort()
+            self.release()
+
+    def release(self):
+        held, self.held = self.held, ()
+        for h in held:
+            h.release()
+
+    def __del__(self):
+        # The result was thrown away without being sent, for instance
+        # because publishing failed after the view was called.
+        self.release()
+
+
+def stream(request, result):
+    """Return `result` as a streaming result if it is an iterator.
+    """
+    if is_stream(result):
+        return StreamResult(request, result)
+    return result
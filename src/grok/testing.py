@@ -17,11 +17,29 @@ from __future__ import print_function
 import sys
 from zope.configuration.config import ConfigurationMachine
 from grokcore.component import zcml
+from martian.scan import module_info_from_dotted_name
+from grok.zcml import import_modules, module_infos
 # Provide this import here for BBB reasons:
 from grokcore.component.testing import grok_component
 
 
-def grok(module_name=None):
+META_PACKAGES = [
+    'grokcore.component.meta',
+    'grokcore.security.meta',
+    'grokcore.view.meta',
+    'grokcore.view.templatereg',
+    'grokcore.viewlet.meta',
+    'grokcore.formlib.meta',
+    'grokcore.annotation.meta',
+    'grokcore.site.meta',
+    'grokcore.catalog.meta',
+    'grokcore.traverser.meta',
+    'grokcore.rest.meta',
+    'grokcore.xmlrpc.meta',
+    ]
+
+
+def grok(module_name=None, workers=None):
     """Grok a module.
 
     Test helper to 'grok' a module named by `module_name`, a dotted
@@ -30,20 +48,22 @@ def grok(module_name=None):
     like ``grok.context()`` etc. This is only needed if your module
     was not `grokked` during test setup time as it normally happens
     with functional tests.
+
+    If `workers` is larger than one, the modules are imported using
+    that many threads before they are grokked one by one.
     """
     config = ConfigurationMachine()
-    zcml.do_grok('grokcore.component.meta', config)
-    zcml.do_grok('grokcore.security.meta', config)
-    zcml.do_grok('grokcore.view.meta', config)
-    zcml.do_grok('grokcore.view.templatereg', config)
-    zcml.do_grok('grokcore.viewlet.meta', config)
-    zcml.do_grok('grokcore.formlib.meta', config)
-    zcml.do_grok('grokcore.annotation.meta', config)
-    zcml.do_grok('grokcore.site.meta', config)
-    zcml.do_grok('grokcore.catalog.meta', config)
-    zcml.do_grok('grokcore.traverser.meta', config)
-    zcml.do_grok('grokcore.rest.meta', config)
-    zcml.do_grok('grokcore.xmlrpc.meta', config)
+    if workers is not None and workers > 1:
+        dotted_names = list(META_PACKAGES)
+        if module_name is not None:
+            dotted_names.append(module_name)
+        infos = []
+        for dotted_name in dotted_names:
+            infos.extend(module_infos(module_info_from_dotted_name(
+                dotted_name, zcml.skip_tests)))
+        import_modules(infos, workers)
+    for dotted_name in META_PACKAGES:
+        zcml.do_grok(dotted_name, config)
     if module_name is not None:
         zcml.do_grok(module_name, config)
     config.execute_actions()
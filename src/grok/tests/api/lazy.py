@@ -0,0 +1,42 @@
+"""
+Importing grok does not import the grokcore packages for forms, layouts,
+viewlets, sites and the like.  Run in a fresh interpreter to see this::
+
+  >>> import subprocess, sys
+  >>> def loaded(statement, module_name):
+  ...     output = subprocess.check_output([
+  ...         sys.executable, '-W', 'ignore', '-c',
+  ...         '%s; import sys; print(%r in sys.modules)' % (
+  ...             statement, module_name)])
+  ...     return output.decode().strip()
+
+  >>> loaded('import grok', 'grokcore.formlib')
+  'False'
+  >>> loaded('import grok', 'grokcore.site')
+  'False'
+
+They are imported as soon as one of their components is looked up::
+
+  >>> loaded('import grok; grok.Fields', 'grokcore.formlib')
+  'True'
+  >>> loaded('import grok; grok.View', 'grokcore.formlib')
+  'True'
+
+The Grok API is the same as if everything was imported up front::
+
+  >>> import grok
+  >>> from grok.interfaces import IGrokAPI
+  >>> IGrokAPI.providedBy(grok)
+  True
+  >>> 'Viewlet' in dir(grok) and 'Viewlet' in grok.__all__
+  True
+  >>> import grokcore.viewlet
+  >>> grok.ViewletManager is grokcore.viewlet.ViewletManager
+  True
+
+  >>> grok.NoSuchThing
+  Traceback (most recent call last):
+    ...
+  AttributeError: module 'grok' has no attribute 'NoSuchThing'
+
+"""
@@ -0,0 +1,103 @@
+"""
+
+The grok.BTreeOrderedContainer keeps the mapping keys in order, like
+grok.OrderedContainer. The order is kept in BTrees too, so that adding,
+removing and moving a single item does not rewrite the order of all the
+other items.
+
+  >>> grok.testing.grok(__name__)
+
+  >>> from zope.container.interfaces import IOrderedContainer
+  >>> bones = OrderedBones()
+  >>> IOrderedContainer.providedBy(bones)
+  True
+  >>> from zope.container.btree import BTreeContainer
+  >>> isinstance(bones, BTreeContainer)
+  True
+
+Order is initially determined by the sequence in which items were
+added. The container counts the container modified events it gets::
+
+  >>> bones['thigh'] = Bone('Thigh Bone')
+  >>> bones['knee'] = Bone('Knee Cap')
+  >>> bones['shin'] = Bone('Shin Bone')
+  >>> bones['ankle'] = Bone('Ankle Joint')
+  >>> bones.keys()
+  ['thigh', 'knee', 'shin', 'ankle']
+  >>> len(changes)
+  4
+  >>> [bone.name for bone in bones.values()]
+  ['Thigh Bone', 'Knee Cap', 'Shin Bone', 'Ankle Joint']
+
+Single items are moved in front of another item, or to the end::
+
+  >>> bones.move('ankle', before='thigh')
+  >>> bones.keys()
+  ['ankle', 'thigh', 'knee', 'shin']
+  >>> bones.move('thigh')
+  >>> bones.keys()
+  ['ankle', 'knee', 'shin', 'thigh']
+
+Moving an item to where it already is does nothing::
+
+  >>> bones.move('knee', before='shin')
+  >>> bones.move('thigh')
+  >>> len(changes)
+  6
+
+Items keep their place when others are removed::
+
+  >>> del bones['knee']
+  >>> bones.keys()
+  ['ankle', 'shin', 'thigh']
+  >>> bones['toe'] = Bone('Toe')
+  >>> list(bones)
+  ['ankle', 'shin', 'thigh', 'toe']
+
+There is room for many items between two neighbours. When it runs out,
+the items are renumbered::
+
+  >>> for i in range(40):
+  ...     bones['rib%02d' % i] = Bone('Rib')
+  ...     bones.move('rib%02d' % i, before='shin')
+  >>> keys = bones.keys()
+  >>> keys[:3], keys[-4:]
+  (['ankle', 'rib00', 'rib01'], ['rib39', 'shin', 'thigh', 'toe'])
+  >>> len(keys)
+  44
+
+The order can also be changed completely::
+
+  >>> del changes[:]
+  >>> bones.updateOrder(order=list(reversed(keys)))
+  >>> len(changes)
+  1
+  >>> bones.keys()[:4]
+  ['toe', 'thigh', 'shin', 'rib39']
+
+Reordering with a wrong set of keys fails::
+
+  >>> bones.updateOrder(order=['ankle', 'shin', 'knee', 'thigh'])
+  Traceback (most recent call last):
+  ...
+  ValueError: Incompatible key set.
+
+"""
+import grok
+from zope.container.interfaces import IContainerModifiedEvent
+
+changes = []
+
+
+class OrderedBones(grok.BTreeOrderedContainer):
+    pass
+
+
+class Bone(grok.Model):
+    def __init__(self, name):
+        self.name = name
+
+
+@grok.subscribe(OrderedBones, IContainerModifiedEvent)
+def container_changed(object, event):
+    changes.append(event)
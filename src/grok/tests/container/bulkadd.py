@@ -0,0 +1,72 @@
+"""
+Many items can be added to a container at once. The objects are stored
+first, then an added event is sent for each of them, and a single
+modified event for the container::
+
+  >>> grok.testing.grok(__name__)
+  >>> bones = Bones()
+  >>> grok.bulk_add(bones, [('skull', Bone()), ('thigh', Bone())])
+  Bone skull added, 2 bones in the container
+  Bone thigh added, 2 bones in the container
+  Container has changed!
+  ['skull', 'thigh']
+  >>> sorted(bones.keys())
+  ['skull', 'thigh']
+  >>> len(bones)
+  2
+  >>> bones['skull'].__parent__ is bones
+  True
+
+Nothing is added when one of the names is taken::
+
+  >>> grok.bulk_add(bones, {'rib': Bone(), 'skull': Bone()})
+  Traceback (most recent call last):
+    ...
+  KeyError: 'skull'
+  >>> len(bones)
+  2
+
+The items can also be collected in a ``with`` block::
+
+  >>> with grok.deferred_add(bones) as items:
+  ...     items['rib'] = Bone()
+  ...     items['toe'] = Bone()
+  Bone rib added, 4 bones in the container
+  Bone toe added, 4 bones in the container
+  Container has changed!
+
+Ordered containers keep the order the items are given in::
+
+  >>> ordered = OrderedBones()
+  >>> grok.bulk_add(ordered, [('thigh', Bone()), ('skull', Bone())])
+  Bone thigh added, 2 bones in the container
+  Bone skull added, 2 bones in the container
+  ['thigh', 'skull']
+  >>> list(ordered.keys())
+  ['thigh', 'skull']
+
+"""
+import grok
+
+
+class Bones(grok.Container):
+    pass
+
+
+class OrderedBones(grok.OrderedContainer):
+    pass
+
+
+class Bone(grok.Model):
+    pass
+
+
+@grok.subscribe(Bone, grok.IObjectAddedEvent)
+def bone_added(bone, event):
+    print('Bone %s added, %d bones in the container' % (
+        bone.__name__, len(event.newParent)))
+
+
+@grok.subscribe(Bones, grok.IContainerModifiedEvent)
+def container_changed(container, event):
+    print('Container has changed!')
@@ -0,0 +1,26 @@
+"""
+The modules to grok can be imported by a pool of worker threads.  The
+grokking itself still happens module by module, so grokker priorities
+are respected just like without workers::
+
+  >>> import grok
+  >>> grok.testing.grok('grok.tests.grokker.priority', workers=4)
+  >>> grok.testing.grok('grok.tests.grokker.priority_fixture', workers=4)
+  beta
+  alpha
+  gamma
+
+The same holds for the ``<grok:grok>`` directive, where the number of
+workers is taken from the ``GROK_SCAN_WORKERS`` environment variable
+or passed to ``do_grok()`` directly.  Conflicts are detected as usual::
+
+  >>> from zope.configuration.config import ConfigurationMachine
+  >>> from grok.zcml import do_grok
+  >>> config = ConfigurationMachine()
+  >>> do_grok('grok.tests.conflict', config, workers=4)
+  >>> config.execute_actions()
+  Traceback (most recent call last):
+    ...
+  zope.configuration.config.ConfigurationConflictError: Conflicting configuration actions For: ('restprotocol', 'foo')
+
+"""
@@ -60,6 +60,7 @@ def test_suite():
     suite = unittest.TestSuite()
     for name in [
         'adapter',
+        'api',
         'baseclass',
         'conflict',
         'container',
@@ -0,0 +1,66 @@
+"""
+The outcome of grokking a module can be cached on disk, so that the
+next start-up replays it instead of running the grokkers again::
+
+  >>> import tempfile
+  >>> from zope.configuration.config import ConfigurationMachine
+  >>> from grok.scancache import ScanCache
+  >>> from grok.zcml import do_grok
+  >>> cache = ScanCache(tempfile.mkdtemp())
+
+The first time around there is nothing in the cache, so the module is
+grokked as usual::
+
+  >>> config = ConfigurationMachine()
+  >>> do_grok('grok.tests.zcml.scancache_fixture', config, cache=cache)
+  >>> config.execute_actions()
+  >>> cache.hits, cache.misses
+  (0, 1)
+
+  >>> from grok.tests.zcml.scancache_fixture import Cave, IHome, Painting
+  >>> IHome(Cave())
+  <grok.tests.zcml.scancache_fixture.Home object at ...>
+
+We now simulate a new start-up by tearing down the component
+registrations.  This time the actions come from the cache::
+
+  >>> from zope.testing import cleanup
+  >>> cleanup.cleanUp()
+  >>> grok.testing.grok()
+  >>> del Painting.module_info
+
+  >>> config = ConfigurationMachine()
+  >>> do_grok('grok.tests.zcml.scancache_fixture', config, cache=cache)
+  >>> config.execute_actions()
+  >>> cache.hits, cache.misses
+  (1, 1)
+
+The registrations are the same as before, and so are the attributes the
+grokkers set on the classes::
+
+  >>> IHome(Cave())
+  <grok.tests.zcml.scancache_fixture.Home object at ...>
+
+  >>> from zope.publisher.browser import TestRequest
+  >>> from zope import component
+  >>> view = component.getMultiAdapter(
+  ...     (Cave(), TestRequest()), name='painting')
+  >>> print(view())
+  A cave painting.
+  >>> Painting.module_info
+  <ModuleInfo object for 'grok.tests.zcml.scancache_fixture'>
+
+Modules that define grokkers are never cached, as grokking them changes
+what other modules grok into::
+
+  >>> cache.misses = 0
+  >>> do_grok('grok.tests.grokker.priority', ConfigurationMachine(),
+  ...         cache=cache)
+  >>> cache.hits, cache.misses
+  (1, 0)
+
+  >>> import shutil
+  >>> shutil.rmtree(cache.directory)
+
+"""
+import grok
@@ -0,0 +1,21 @@
+import grok
+from zope import interface
+
+
+class Cave(grok.Model):
+    pass
+
+
+class IHome(interface.Interface):
+    pass
+
+
+@grok.implementer(IHome)
+class Home(grok.Adapter):
+    pass
+
+
+class Painting(grok.View):
+
+    def render(self):
+        return 'A cave painting.'
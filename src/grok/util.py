@@ -13,12 +13,20 @@
 ##############################################################################
 """Grok utility functions.
 """
+import email.utils
+import hashlib
+
+import ZODB.utils
 import zope.component.hooks
 import zope.location.location
+import zope.security.management
 
+from zope import component
 from zope import interface
+from zope.lifecycleevent.interfaces import IObjectMovedEvent
 from grokcore.view.util import url, ASIS
 from grokcore.site.util import getApplication
+from persistent.timestamp import TimeStamp
 
 
 def safely_locate_maybe(obj, parent, name):
@@ -46,9 +54,125 @@ def applySkin(request, skin, skin_type):
     interface.directlyProvides(request, *ifaces)
 
 
+URL_CACHE_KEY = 'grok.url_cache'
+
+
+def _url_cache(request):
+    annotations = getattr(request, 'annotations', None)
+    if annotations is None:
+        return None
+    return annotations.setdefault(URL_CACHE_KEY, {})
+
+
+def cached_url(request, obj, name=None, skin=ASIS, data=None):
+    """Return the URL of `obj` like :func:`grokcore.view.util.url` does.
+
+    URLs are remembered for the duration of `request`, so that asking
+    for the same URL again does not walk up the object tree again.
+    """
+    cache = _url_cache(request)
+    if cache is None:
+        return url(request, obj, name, skin, data)
+    try:
+        key = (id(obj), name, skin, tuple(sorted((data or {}).items())))
+        cached = cache.get(key)
+    except TypeError:
+        # Data that cannot be used in a key, such as lists of values.
+        return url(request, obj, name, skin, data)
+    if cached is None:
+        # Keep a reference to obj, so that its id is not reused.
+        cached = cache[key] = (obj, url(request, obj, name, skin, data))
+    return cached[1]
+
+
+def _application(request):
+    cache = _url_cache(request)
+    if cache is None:
+        return getApplication()
+    # The nearest application depends on the site traversal has
+    # reached so far.
+    site = zope.component.hooks.getSite()
+    key = ('application', id(site))
+    cached = cache.get(key)
+    if cached is None:
+        cached = cache[key] = (site, getApplication())
+    return cached[1]
+
+
+@component.adapter(IObjectMovedEvent)
+def clearURLCache(event):
+    """Forget the URLs computed so far, as the object tree changed.
+    """
+    interaction = zope.security.management.queryInteraction()
+    if interaction is None:
+        return
+    for participation in interaction.participations:
+        annotations = getattr(participation, 'annotations', None)
+        if annotations is not None:
+            annotations.pop(URL_CACHE_KEY, None)
+
+
 def application_url(request, obj, name=None, skin=ASIS, data={}):
     """Return the URL of the nearest enclosing :class:`grok.Application`.
 
     Raises :exc:`ValueError` if no application can be found.
     """
-    return url(request, getApplication(), name=name, skin=skin, data=data)
+    return cached_url(
+        request, _application(request), name=name, skin=skin, data=data)
+
+
+def validators(view):
+    """Return the ETag and the Last-Modified time of `view`.
+
+    They are computed from the serial of the last committed change of
+    the view's context, the class of the view and the principal.
+    Returns ``None`` if the context is not a committed persistent
+    object.
+    """
+    context = view.context
+    if getattr(context, '_p_jar', None) is None:
+        return None
+    # A ghost does not know its serial yet.
+    context._p_activate()
+    serial = context._p_serial
+    if serial == ZODB.utils.z64:
+        return None
+    principal = getattr(view.request.principal, 'id', '')
+    key = hashlib.sha1(serial)
+    key.update(('%s.%s %s' % (
+        view.__class__.__module__,
+        view.__class__.__name__,
+        principal)).encode('utf-8'))
+    return 'W/"%s"' % key.hexdigest(), TimeStamp(serial).timeTime()
+
+
+def _weak(etag):
+    if etag.startswith('W/'):
+        return etag[2:]
+    return etag
+
+
+def not_modified(request, etag, modified):
+    """Tell whether the copy the client of `request` has is up to date.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    if_none_match = request.getHeader('If-None-Match')
+    if if_none_match is not None:
+        tags = [_weak(tag.strip()) for tag in if_none_match.split(',')]
+        return '*' in tags or _weak(etag) in tags
+    if_modified_since = request.getHeader('If-Modified-Since')
+    if if_modified_since is not None:
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have a resolution of seconds.
+        return int(modified) <= since.timestamp()
+    return False
+
+
+def set_validators(response, etag, modified):
+    response.setHeader('ETag', etag)
+    response.setHeader(
+        'Last-Modified', email.utils.formatdate(modified, usegmt=True))
@@ -0,0 +1,102 @@
+##############################################################################
+#
+# Copyright (c) 2006-2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Frozen view lookup.
+
+Once an application has been grokked, its view registrations rarely
+change.  In frozen mode, the view factory found for a combination of
+context, request and view name is kept in a flat table per adapter
+registry, so that looking up the same view again is a single dictionary
+lookup.  A table is thrown away as soon as its registry, or one of the
+registries it is based on, changes.
+
+Frozen mode is enabled by setting the ``GROK_FROZEN_VIEWS`` environment
+variable to ``on`` or by calling :func:`freeze`.
+"""
+import os
+
+import zope.component
+import zope.traversing.namespace
+from zope.interface import Interface, providedBy
+from zope.location.interfaces import LocationError
+
+FROZEN_VIEWS_ENVIRON = 'GROK_FROZEN_VIEWS'
+
+_frozen = os.environ.get(
+    FROZEN_VIEWS_ENVIRON, 'no').lower() in ('yes', 'on', 'true')
+
+def freeze():
+    """Look up views through the dispatch tables."""
+    global _frozen
+    _frozen = True
+
+
+def thaw():
+    """Look up views through zope.component again."""
+    global _frozen
+    _frozen = False
+
+
+def is_frozen():
+    return _frozen
+
+
+def _table(registry):
+    # zope.interface bumps the generation of a registry whenever it, or
+    # any registry it is based on, changes.
+    try:
+        generation, table = registry._v_grok_view_table
+    except AttributeError:
+        generation = None
+    if generation != registry._generation:
+        table = {}
+        registry._v_grok_view_table = (registry._generation, table)
+    return table
+
+
+def queryView(context, request, name, default=None):
+    """Look up the view `name` for `context` and `request`.
+
+    This is equivalent to ``zope.component.queryMultiAdapter((context,
+    request), name=name, default=default)``.
+    """
+    if not _frozen:
+        return zope.component.queryMultiAdapter(
+            (context, request), name=name, default=default)
+    registry = zope.component.getSiteManager().adapters
+    table = _table(registry)
+    key = (providedBy(context), providedBy(request), name)
+    try:
+        factory = table[key]
+    except KeyError:
+        factory = table[key] = registry.lookup(key[:2], Interface, name)
+    if factory is None:
+        return default
+    view = factory(context, request)
+    if view is None:
+        return default
+    return view
+
+
+class view(zope.traversing.namespace.view):
+    """Traversal adapter for the ``@@`` namespace of Grok contexts.
+
+    Default views of Grok contexts are traversed to through this
+    namespace as well.
+    """
+
+    def traverse(self, name, ignored):
+        result = queryView(self.context, self.request, name)
+        if result is None:
+            raise LocationError(self.context, name)
+        return result
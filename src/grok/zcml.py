@@ -0,0 +1,115 @@
+##############################################################################
+#
+# Copyright (c) 2006-2007 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""The ``<grok:grok>`` ZCML directive.
+
+This replaces the directive from grokcore.component with one that can
+replay cached grokking outcomes (see :mod:`grok.scancache`) and import
+the modules of a package across a pool of worker threads.  Grokking
+itself always happens in a single thread, module by module, in the same
+order as without workers.  The configuration actions, and hence conflict
+detection and grokker priorities, are therefore exactly the same.
+"""
+import fnmatch
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import martian.scan
+import grokcore.component.zcml
+
+from grok import scancache
+
+WORKERS_ENVIRON = 'GROK_SCAN_WORKERS'
+
+
+def module_infos(module_info):
+    """Return the module infos of a package and all its sub-modules.
+
+    They are listed in the order in which martian groks them.
+    """
+    result = [module_info]
+    for sub_module_info in module_info.getSubModuleInfos():
+        result.extend(module_infos(sub_module_info))
+    return result
+
+
+def _import(module_info):
+    try:
+        module_info.getModule()
+    except Exception:
+        # Modules importing each other from different threads may fail
+        # here.  Importing them again while grokking will either succeed
+        # or report the actual error.
+        pass
+
+
+def import_modules(module_infos, workers):
+    """Import the modules of `module_infos` using `workers` threads."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for ignored in executor.map(_import, module_infos):
+            pass
+
+
+def _workers(workers):
+    if workers is None:
+        workers = int(os.environ.get(WORKERS_ENVIRON) or 0)
+    return workers
+
+
+def do_grok(dotted_name, config, extra_exclude=None, cache=None,
+            workers=None):
+    """Grok the package or module `dotted_name`.
+
+    Behaves like ``grokcore.component.zcml.do_grok`` unless a `cache`
+    or more than one worker is given, either as arguments or through
+    the ``GROK_SCAN_CACHE`` and ``GROK_SCAN_WORKERS`` environment
+    variables.
+    """
+    if cache is None:
+        directory = os.environ.get(scancache.CACHE_DIR_ENVIRON)
+        if directory:
+            cache = scancache.ScanCache(directory)
+    workers = _workers(workers)
+    if cache is None and workers <= 1:
+        return grokcore.component.zcml.do_grok(
+            dotted_name, config, extra_exclude)
+
+    skip_tests = grokcore.component.zcml.skip_tests
+    if extra_exclude is not None:
+        def exclude_filter(name):
+            if skip_tests(name):
+                return True
+            for exclude in extra_exclude:
+                if fnmatch.fnmatch(name, exclude):
+                    return True
+            return False
+    else:
+        exclude_filter = skip_tests
+
+    infos = module_infos(martian.scan.module_info_from_dotted_name(
+        dotted_name, exclude_filter, True))
+    if workers > 1:
+        import_modules(infos, workers)
+    grokker = grokcore.component.zcml.the_module_grokker
+    for module_info in infos:
+        if cache is not None:
+            scancache.grok_module(module_info, config, cache)
+        else:
+            grokker.grok(module_info.dotted_name, module_info.getModule(),
+                         module_info=module_info, config=config)
+
+
+def grokDirective(_context, package, exclude=None):
+    if not exclude:
+        exclude = None
+    do_grok(package.__name__, _context, extra_exclude=exclude)